@@ -3,72 +3,170 @@
 __version__ = "0.1.0"
 
 import os
+import re
+import string
+import threading
+import time
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import asdict
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+_LAZY_ATTRS = {
+    "SQLiteStorage": "cruxvault.storage.local",
+    "Encryptor": "cruxvault.crypto.encryption",
+    "get_storage_and_audit": "cruxvault.utils.utils",
+    "ConfigManager": "cruxvault.config",
+}
+
+_GET_CACHE_SIZE = 1024
+_SECRET_FIELDS = attrgetter("path", "type", "version", "tags", "created_at", "updated_at")
+_LIST_COLUMNS = ("Path", "Type", "Version", "Tags", "Updated")
+_HISTORY_COLUMNS = ("Version", "Created", "Created By", "Value Preview")
+
+# database/primary-host -> DATABASE_PRIMARY_HOST in a single translate pass
+_ENV_TRANS = str.maketrans("/-" + string.ascii_lowercase, "__" + string.ascii_uppercase)
+
+
+def _env_name(path: str) -> str:
+    name = path.translate(_ENV_TRANS)
+    # The table only covers ASCII; other scripts still need str.upper()
+    return name if name.isascii() else name.upper()
+
+
+# KEY=value lines; blank lines, comments and lines without "=" don't match
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+
+def _make_table(columns: tuple, title: Optional[str] = None) -> "Table":
+    from rich.table import Table
+
+    table = Table(show_header=True, title=title)
+    for column in columns:
+        table.add_column(column)
+    return table
+
+
+def _print_secrets_table(secrets: list) -> None:
+    from cruxvault.utils.console import console
+
+    table = _make_table(_LIST_COLUMNS)
+    for s in secrets:
+        table.add_row(
+            s.path,
+            s.type.value,
+            str(s.version),
+            ", ".join(s.tags),
+            s.updated_at.isoformat()[:10]
+        )
+    console.print(table)
+
+
+def _print_history_table(path: str, versions: list) -> None:
+    from cruxvault.utils.console import console
+
+    table = _make_table(_HISTORY_COLUMNS, title=f"History for {path}")
+    for v in versions:
+        table.add_row(
+            str(v.version),
+            v.created_at.isoformat()[:19],
+            v.created_by or "unknown",
+            v.value[:20] + "..." if len(v.value) > 20 else v.value
+        )
+    console.print(table)
 
-from cruxvault.storage.local import SQLiteStorage
-from cruxvault.crypto.encryption import Encryptor
-from cruxvault.utils.utils import get_storage_and_audit
-from cruxvault.config import ConfigManager
 
 class CruxVault:
-    def __init__(self, root: Path = None):
-        storage, _ = get_storage_and_audit()
+    def __init__(self, root: Path = None, tune_sqlite: bool = None, cache_ttl: float = 30.0):
+        if tune_sqlite is None:
+            tune_sqlite = os.getenv("CRUXVAULT_SQLITE_TUNING", "1") not in ("", "0")
+        from cruxvault.utils.utils import get_storage_and_audit
+
+        storage, _ = get_storage_and_audit(tune_sqlite=tune_sqlite)
         self._storage = storage
 
+        # Read-through cache for get(): path -> (expires_at, value). A TTL of 0 disables it.
+        self._cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, str]] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped on every invalidation; a read that raced a write is not cached
+        self._cache_generation = 0
+
     def get(self, path: str) -> str:
-        return self._storage.get_secret(path).value
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            generation = self._cache_generation
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        value = self._storage.get_secret(path).value
+
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    if len(self._cache) >= _GET_CACHE_SIZE:
+                        self._cache.pop(next(iter(self._cache)))
+                    self._cache[path] = (now + self._cache_ttl, value)
+        return value
+
+    def mget(self, paths: list) -> dict:
+        # One IN (...) query and one batched decrypt; paths that don't exist are left out
+        secrets = self._storage.get_secrets(paths)
+        return {path: secret.value for path, secret in secrets.items()}
+
+    def _invalidate_cache(self) -> None:
+        # Values may expand ${other/path} references, so any write can affect any entry
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
 
     def set(self, path: str, value: str, tags: list = None) -> None:
         self._storage.set_secret(path, value, tags=tags)
+        self._invalidate_cache()
 
     def delete(self, path: str) -> bool:
-        return self._storage.delete_secret(path)
+        deleted = self._storage.delete_secret(path)
+        self._invalidate_cache()
+        return deleted
+
+    def mdelete(self, paths: list) -> int:
+        deleted = self._storage.delete_secrets(paths)
+        self._invalidate_cache()
+        return deleted
 
     def list(self, prefix: str = None, print_: bool = False) -> list:
         secrets = self._storage.list_secrets(prefix)
-        
-        data = [
+
+        if print_:
+            _print_secrets_table(secrets)
+            return None
+
+        return [
             {
-                "path": s.path,
-                "type": s.type.value,
-                "version": s.version,
-                "tags": s.tags,
-                "created_at": s.created_at.isoformat(),
-                "updated_at": s.updated_at.isoformat(),
+                "path": path,
+                "type": secret_type.value,
+                "version": version,
+                "tags": tags,
+                "created_at": created_at.isoformat(),
+                "updated_at": updated_at.isoformat(),
             }
-            for s in secrets
+            for path, secret_type, version, tags, created_at, updated_at in map(
+                _SECRET_FIELDS, secrets
+            )
         ]
-        
-        if print_:
-            console = Console()
-            table = Table(show_header=True)
-            table.add_column("Path")
-            table.add_column("Type")
-            table.add_column("Version")
-            table.add_column("Tags")
-            table.add_column("Updated")
-            
-            for item in data:
-                table.add_row(
-                    item["path"],
-                    item["type"],
-                    str(item["version"]),
-                    ", ".join(item["tags"]),
-                    item["updated_at"][:10]
-                )
-            
-            console.print(table)
-            return None
-        
-        return data
 
     def history(self, path: str, print_: bool = False) -> dict:
         versions = self._storage.get_history(path)
-        
-        data = [
+
+        if print_:
+            _print_history_table(path, versions)
+            return None
+
+        return [
             {
                 "version": v.version,
                 "value": v.value,
@@ -77,81 +175,50 @@ class CruxVault:
             }
             for v in versions
         ]
-        
-        if print_:
-            console = Console()
-            table = Table(title=f"History for {path}")
-            table.add_column("Version")
-            table.add_column("Created")
-            table.add_column("Created By")
-            table.add_column("Value Preview")
-            
-            for v in data:
-                table.add_row(
-                    str(v["version"]),
-                    v["created_at"][:19],
-                    v["created_by"],
-                    v["value"][:20] + "..." if len(v["value"]) > 20 else v["value"]
-                )
-            
-            console.print(table)
-            return None
-        
-        return data
     
     def rollback(self, path: str, version: int) -> None:
         self._storage.rollback(path, version)
+        self._invalidate_cache()
 
-    def import_env(self, file_path: str, prefix: str = None) -> None:
-        storage, _ = get_storage_and_audit()
-        imported = 0
+    def import_env(self, file_path: str, prefix: str = None) -> int:
         with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                   continue
-                if "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                if not value:
-                    continue
-                path = key.lower().replace("_", "/")
-                if prefix:
-                    path = f"{prefix}/{path}"
-                try:
-                    storage.set_secret(path, value, "config", ["imported"])
-                    imported += 1
-                except Exception:
-                    continue
-        return imported
+            content = f.read()
+
+        entries = []
+        for match in _ENV_LINE_RE.finditer(content):
+            key, value = match.groups()
+            value = value.strip('"').strip("'")
+            if not value:
+                continue
+            path = key.lower().replace("_", "/")
+            if prefix:
+                path = f"{prefix}/{path}"
+            entries.append((path, value))
+        self._storage.set_secrets_bulk(entries, "config", ["imported"])
+        self._invalidate_cache()
+        return len(entries)
 
     def export_env(self) -> dict:
-        storage, _ = get_storage_and_audit()
-        exported = 0
-        secrets_list = storage.list_secrets()
+        secrets_list = self._storage.list_secrets()
         if not secrets_list:
             return ""
 
-        lines = []
-        for secret in secrets_list:
-            # Convert path to env var name (database/password -> DATABASE_PASSWORD)
-            env_name = secret.path.replace("/", "_").replace("-", "_").upper()
-            lines.append(f'{env_name}="{secret.value}"')
-
-        env_content = "\n".join(lines)
-        return env_content
+        # Convert path to env var name (database/password -> DATABASE_PASSWORD)
+        return "\n".join(
+            f'{_env_name(secret.path)}="{secret.value}"'
+            for secret in secrets_list
+        )
 
     def load_crux_secrets(self, prefix: str = None) -> None:
-        storage, _ = get_storage_and_audit()
-        secrets_list = storage.list_secrets(prefix)
+        secrets_list = self._storage.list_secrets(prefix)
 
         for secret in secrets_list:
             value = self.get(secret.path)
             os.environ[secret.path] = value
 
     def get_audit_path(self) -> Path:
+        from cruxvault.config import ConfigManager
+
         config = ConfigManager()
         path = config.find_crux_root()
         if not path:
@@ -159,23 +226,35 @@ class CruxVault:
         return path / config.config_dir / "audit.log"
 
 
-_instance = None
+class _Singleton:
+    instance = None
+    lock = threading.Lock()
+
 
 def _get_instance():
-    global _instance
-    if _instance is None:
-        _instance = CruxVault()
-    return _instance
+    instance = _Singleton.instance
+    if instance is None:
+        with _Singleton.lock:
+            if _Singleton.instance is None:
+                _Singleton.instance = CruxVault()
+            instance = _Singleton.instance
+    return instance
 
 def get(path: str) -> str:
     return _get_instance().get(path)
 
+def mget(paths: list) -> dict:
+    return _get_instance().mget(paths)
+
 def set(path: str, value: str, tags: list = None):
     return _get_instance().set(path, value, tags)
 
 def delete(path: str):
     return _get_instance().delete(path)
 
+def mdelete(paths: list):
+    return _get_instance().mdelete(paths)
+
 def list(prefix: str = None, print_: bool = False):
     return _get_instance().list(prefix, print_)
 
@@ -185,7 +264,7 @@ def history(path: str, print_: bool = False):
 def rollback(path: str, version: int):
     return _get_instance().rollback(path, version)
 
-def import_env(path: str, prefix: str = None):
+def import_env(path: str, prefix: str = None) -> int:
     return _get_instance().import_env(path, prefix)
 
 def export_env():
@@ -197,5 +276,17 @@ def get_audit_path():
 def load_crux_secrets():
     return _get_instance().load_crux_secrets()
 
-__all__ = ['CruxVault', 'get', 'set', 'delete', 'list', 'history', 'rollback', 'import_env', 'export_env', 'get_audit_path', 'load_crux_secrets']
+__all__ = ['CruxVault', 'get', 'mget', 'set', 'delete', 'mdelete', 'list', 'history', 'rollback', 'import_env', 'export_env', 'get_audit_path', 'load_crux_secrets']
+
+
+
+def __getattr__(name: str):
+    # Heavy modules (SQLAlchemy, pydantic, keyring) load on first use, so importing
+    # cruxvault for a submodule such as the CLI's quiet get stays cheap
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
 
+    return getattr(importlib.import_module(module), name)
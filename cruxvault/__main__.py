@@ -1,7 +1,89 @@
 """Main entry point for cruxvault CLI."""
 
-from cruxvault.cli import main
+import sys
+from typing import Optional
+
+
+def _quiet_get_path(argv: list[str]) -> Optional[str]:
+    # Matches `get <path> -q` / `get <path> --quiet` with no other options
+    if len(argv) != 3 or argv[0] != "get":
+        return None
+    args = argv[1:]
+    flags = [a for a in args if a in ("-q", "--quiet")]
+    paths = [a for a in args if not a.startswith("-")]
+    if len(flags) != 1 or len(paths) != 1:
+        return None
+    return paths[0]
+
+
+def _quiet_get(path: str) -> bool:
+    # Fast path for `VAR=$(crux get foo -q)`: read the row with sqlite3 and decrypt it,
+    # without loading typer, rich, SQLAlchemy or pydantic. Anything it can't answer on
+    # its own (audited reads, ${...} references, missing secrets, errors) falls through
+    # to the full CLI.
+    import os
+    import sqlite3
+    from pathlib import Path
+
+    import yaml
+
+    config_dir = ".cruxvault"
+    root = Path.cwd()
+    while not (root / config_dir).exists():
+        if root == root.parent:
+            return False
+        root = root.parent
+
+    try:
+        config_path = root / config_dir / "config.yaml"
+        config = {}
+        if config_path.exists():
+            with open(config_path, "r") as f:
+                config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+        audit = config.get("audit") or {}
+        log_reads = os.getenv("CRUXVAULT_AUDIT_READS")
+        log_reads = audit.get("log_reads", False) if log_reads is None else log_reads not in ("", "0")
+        if audit.get("enabled", True) and log_reads:
+            return False
+
+        db_path = (config.get("storage") or {}).get("path", f"{config_dir}/store.db")
+        if not os.path.isabs(db_path):
+            db_path = root / config_dir / os.path.basename(db_path)
+
+        conn = sqlite3.connect(f"{Path(db_path).as_uri()}?mode=ro", uri=True)
+        try:
+            row = conn.execute(
+                "SELECT encrypted_value FROM secrets WHERE path = ?", (path,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return False
+
+        from cruxvault.crypto.encryption import Encryptor
+        from cruxvault.crypto.utils import get_or_create_master_key
+
+        value = Encryptor(get_or_create_master_key()).decrypt(row[0])
+    except Exception:
+        return False
+
+    if "${" in value:
+        return False
+
+    print(value)
+    return True
+
+
+def main() -> None:
+    path = _quiet_get_path(sys.argv[1:])
+    if path is not None and _quiet_get(path):
+        return
+
+    from cruxvault.cli import main as cli_main
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
-
@@ -1,17 +1,85 @@
+import atexit
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from cruxvault.models import AuditEntry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _serialize(entry: AuditEntry) -> bytes:
+    # Both encoders take the same model_dump(), so the log schema follows AuditEntry
+    data = entry.model_dump()
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+# Bytes read per step when scanning the log backwards
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+
+def read_last_lines(log_path: str, limit: int) -> list[bytes]:
+    # Reads backwards from the end in chunks, so the cost follows `limit`, not the log's size
+    if limit <= 0:
+        return []
+
+    chunks = []
+    newlines = 0
+    with open(log_path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= limit:
+            step = min(_TAIL_CHUNK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+
+    lines = b"".join(reversed(chunks)).split(b"\n")
+    if pos > 0:
+        lines = lines[1:]  # Starts mid-line
+    return [line for line in lines if line][-limit:]
+
+
+# Actions skipped unless log_reads is set
+_READ_ACTIONS = frozenset(("get", "list"))
+
+# Buffered loggers holding unwritten entries; flush_all() drains them
+_pending_loggers: set["AuditLogger"] = set()
+
+
+def flush_all() -> None:
+    for logger in list(_pending_loggers):
+        logger.flush()
+
+
+atexit.register(flush_all)
+
 
 class AuditLogger:
-    def __init__(self, log_path: str, enabled: bool = True, log_reads: bool = False) -> None:
+    def __init__(
+        self,
+        log_path: str,
+        enabled: bool = True,
+        log_reads: bool = False,
+        buffered: bool = False,
+    ) -> None:
         self.log_path = log_path
         self.enabled = enabled
         self.log_reads = log_reads
+        self.buffered = buffered
+        self._user = os.getenv("USER", "unknown")
+        self._fd: Optional[int] = None
+        self._pending: list[bytes] = []
+        self._lock = threading.Lock()
 
         log_dir = os.path.dirname(log_path)
         if log_dir:
@@ -28,12 +96,12 @@ class AuditLogger:
         if not self.enabled:
             return
 
-        if not self.log_reads and action in ["get", "list"]:
+        if not self.log_reads and action in _READ_ACTIONS:
             return
 
         entry = AuditEntry(
             timestamp=datetime.utcnow(),
-            user=os.getenv("USER", "unknown"),
+            user=self._user,
             action=action,
             path=path,
             success=success,
@@ -41,25 +109,57 @@ class AuditLogger:
             metadata=metadata or {},
         )
 
+        line = _serialize(entry) + b"\n"
+
+        if self.buffered:
+            with self._lock:
+                self._pending.append(line)
+                _pending_loggers.add(self)
+            return
+
         try:
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(entry.model_dump(), default=str) + "\n")
+            with self._lock:
+                self._write(line)
         except Exception:
             pass
 
+    def flush(self) -> None:
+        with self._lock:
+            _pending_loggers.discard(self)
+            if not self._pending:
+                return
+            data = b"".join(self._pending)
+            self._pending.clear()
+            try:
+                self._write(data)
+            except Exception:
+                pass
+
+    def _write(self, data: bytes) -> None:
+        if self._fd is None:
+            # O_APPEND keeps each write() atomic at the end of the file; owner-only
+            # permissions since entries name every secret path touched
+            self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
     def get_recent_entries(self, limit: int = 100) -> list[AuditEntry]:
         if not os.path.exists(self.log_path):
             return []
 
         entries = []
         try:
-            with open(self.log_path, "r") as f:
-                lines = f.readlines()
-
-            for line in reversed(lines[-limit:]):
+            for line in reversed(read_last_lines(self.log_path, limit)):
                 try:
-                    data = json.loads(line)
-                    entries.append(AuditEntry(**data))
+                    entries.append(AuditEntry.model_validate_json(line))
                 except Exception:
                     continue
 
@@ -71,17 +171,23 @@ class AuditLogger:
         if not os.path.exists(self.log_path):
             return []
 
+        # Serialized path, used to skip lines that cannot match before parsing them.
+        # Non-ASCII paths may be escaped or raw depending on the writer, so skip the check.
+        needle = json.dumps(path).encode("utf-8") if path.isascii() else None
+
         entries = []
         try:
-            with open(self.log_path, "r") as f:
+            with open(self.log_path, "rb") as f:
                 lines = f.readlines()
 
             # Parse JSON lines and filter by path
             for line in reversed(lines):
+                if needle is not None and needle not in line:
+                    continue
                 try:
-                    data = json.loads(line)
-                    if data.get("path") == path:
-                        entries.append(AuditEntry(**data))
+                    entry = AuditEntry.model_validate_json(line)
+                    if entry.path == path:
+                        entries.append(entry)
                         if len(entries) >= limit:
                             break
                 except Exception:
@@ -1,26 +1,78 @@
+import functools
 import os
 import sys
-import json
 import typer
-import secrets as secrets_lib
-import subprocess
-from rich.table import Table
-from typing import Optional, Any
+from typing import Any, Callable, Optional
 
-from cruxvault.models import SecretType
+from pydantic import TypeAdapter
+
+from cruxvault import _ENV_LINE_RE, _env_name
+from cruxvault.models import SecretType, SecretVersion
+from cruxvault.audit.logger import flush_all as flush_audit_logs
 from cruxvault.config import ConfigManager
-from cruxvault.crypto.encryption import Encryptor
 from cruxvault.utils.console import (
     console,
     create_history_table,
     create_secrets_table,
+    format_diff_entries,
+    format_merge_conflicts,
     print_error,
     print_info,
+    print_json,
     print_success,
     print_warning,
 )
 from cruxvault.utils.utils import get_storage_and_audit, get_audit_logger, get_storage
 
+_VERSION_LIST_ADAPTER = TypeAdapter(list[SecretVersion])
+
+# dev export flushes the output file in 64 KiB chunks
+_EXPORT_BUFFER_SIZE = 1 << 16
+
+_SET_ENV_TEMPLATES = {
+    "bash": 'export %s="%s"\n',
+    "fish": 'set -x %s "%s"\n',
+    "powershell": '$env:%s="%s"\n',
+}
+_UNSET_ENV_TEMPLATES = {
+    "bash": "unset %s;\n",
+    "fish": "set -e %s;\n",
+    "powershell": "Remove-Item Env:%s;\n",
+}
+
+
+def _urlsafe_tokens(*sizes: int) -> list[str]:
+    # Same output as secrets.token_urlsafe(size) per size, from a single entropy read
+    import base64
+    import secrets as secrets_lib
+
+    pool = secrets_lib.token_bytes(sum(sizes))
+    tokens = []
+    offset = 0
+    for size in sizes:
+        tokens.append(base64.urlsafe_b64encode(pool[offset:offset + size]).rstrip(b"=").decode())
+        offset += size
+    return tokens
+
+
+def _audited(action: str, error_message: str) -> Callable:
+    # Shared failure path for secret commands: audit the error, report it, exit 1
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(**kwargs: Any) -> None:
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                audit_logger = get_audit_logger()
+                audit_logger.log(action, kwargs.get("path") or ".", success=False, error=str(e))
+                print_error(f"{error_message}: {e}")
+                sys.exit(1)
+
+        return wrapper
+
+    return decorator
+
+
 app = typer.Typer(
     help="Unified secrets, configs, and feature flags management",
     add_completion=False,
@@ -28,6 +80,13 @@ app = typer.Typer(
 dev_app = typer.Typer(help="Development mode commands")
 app.add_typer(dev_app, name="dev")
 
+
+@app.callback()
+def main_callback(ctx: typer.Context) -> None:
+    # Audit loggers buffer entries; write them once when the command finishes
+    ctx.call_on_close(flush_audit_logs)
+
+
 @app.command()
 def init() -> None:
     config_manager = ConfigManager()
@@ -58,8 +117,22 @@ def init() -> None:
         print_error(f"Initialization failed: {e}")
         sys.exit(1)
 
+    # Diagnostic only: the vault already exists, so a failed probe must not fail init
+    try:
+        from cruxvault.crypto.utils import aes_acceleration
+
+        acceleration = aes_acceleration()
+    except Exception:
+        return
+    if acceleration["aes"] is False or acceleration["clmul"] is False:
+        print_warning(
+            "This CPU does not report AES/carry-less multiply instructions; "
+            f"{acceleration['openssl_version']} will use its slower software AES-GCM"
+        )
+
 
 @app.command()
+@_audited("set", "Failed to set secret")
 def set(
     path: str = typer.Argument(..., help="Secret path (e.g., database/password)"),
     value: str = typer.Argument(..., help="Secret value"),
@@ -67,160 +140,134 @@ def set(
     secret_type: str = typer.Option("secret", "--type", help="Type: secret, config, or flag"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
+    storage, audit_logger = get_storage_and_audit()
+
     try:
-        storage, audit_logger = get_storage_and_audit()
+        SecretType(secret_type)
+    except ValueError:
+        print_error(f"Invalid type: {secret_type}. Must be: secret, config, or flag")
+        sys.exit(1)
 
-        try:
-            SecretType(secret_type)
-        except ValueError:
-            print_error(f"Invalid type: {secret_type}. Must be: secret, config, or flag")
-            sys.exit(1)
+    secret = storage.set_secret(path, value, secret_type, tag or [])
 
-        secret = storage.set_secret(path, value, secret_type, tag or [])
+    audit_logger.log("set", path, success=True, metadata={"tags": tag or []})
 
-        audit_logger.log("set", path, success=True, metadata={"tags": tag or []})
-
-        if json_output:
-            output = secret.model_dump()
-            output["value"] = "•" * 8  # Hide value in JSON output
-            console.print_json(data=output)
-        else:
-            print_success(f"Set {path} (version {secret.version})")
-
-    except Exception as e:
-        audit_logger = get_audit_logger()
-        audit_logger.log("set", path, success=False, error=str(e))
-        print_error(f"Failed to set secret: {e}")
-        sys.exit(1)
+    if json_output:
+        output = secret.model_dump()
+        output["value"] = "•" * 8  # Hide value in JSON output
+        print_json(output)
+    else:
+        print_success(f"Set {path} (version {secret.version})")
 
 
 @app.command()
+@_audited("get", "Failed to get secret")
 def get(
     path: str = typer.Argument(..., help="Secret path"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Only output the value"),
 ) -> None:
-    try:
-        storage, audit_logger = get_storage_and_audit()
+    storage, audit_logger = get_storage_and_audit()
 
-        secret = storage.get_secret(path)
+    secret = storage.get_secret(path)
 
-        audit_logger.log("get", path, success=True)
+    audit_logger.log("get", path, success=True)
 
-        if not secret:
-            print_error(f"Secret not found: {path}")
-            sys.exit(1)
-
-        if quiet:
-            print(secret.value)
-        elif json_output:
-            console.print_json(data=secret.model_dump(mode="json"))
-        else:
-            console.print(secret.value)
-
-    except Exception as e:
-        audit_logger = get_audit_logger()
-        audit_logger.log("get", path, success=False, error=str(e))
-        print_error(f"Failed to get secret: {e}")
+    if not secret:
+        print_error(f"Secret not found: {path}")
         sys.exit(1)
 
+    if quiet:
+        print(secret.value)
+    elif json_output:
+        print_json(secret.model_dump())
+    else:
+        console.print(secret.value)
+
 
 @app.command()
+@_audited("list", "Failed to list secrets")
 def list(
     path: Optional[str] = typer.Argument(None, help="Optional path prefix to filter"),
     show_values: bool = typer.Option(False, "--show-values", help="Show secret values"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
-    try:
-        storage, audit_logger = get_storage_and_audit()
-
-        secrets = storage.list_secrets(path)
+    storage, audit_logger = get_storage_and_audit()
 
+    if json_output:
+        # Rows go straight to dicts; hidden values are never decrypted
+        secrets = storage.list_secrets_as_dicts(path, decrypt_values=show_values)
         audit_logger.log("list", path or ".", success=True)
 
         if not secrets:
             print_info("No secrets found")
             return
 
-        if json_output:
-            output = [s.model_dump(mode="json") for s in secrets]
-            if not show_values:
-                for item in output:
-                    item["value"] = "•" * 8
-            console.print_json(data=output)
-        else:
-            table = create_secrets_table(secrets, show_values=show_values, show_versions=True)
-            console.print(table)
-            console.print(f"\n[dim]Total: {len(secrets)} secret(s)[/dim]")
+        print_json(secrets)
+        return
 
-    except Exception as e:
-        audit_logger = get_audit_logger()
-        audit_logger.log("list", path or ".", success=False, error=str(e))
-        print_error(f"Failed to list secrets: {e}")
-        sys.exit(1)
+    # Rows stream into the table; values are masked unless --show-values, so only decrypt then
+    secrets = storage.iter_secrets(path, decrypt_values=show_values)
+    table = create_secrets_table(secrets, show_values=show_values, show_versions=True)
+    audit_logger.log("list", path or ".", success=True)
+
+    if not table.row_count:
+        print_info("No secrets found")
+        return
+
+    console.print(table)
+    console.print(f"\n[dim]Total: {table.row_count} secret(s)[/dim]")
 
 
 @app.command()
+@_audited("delete", "Failed to delete secret")
 def delete(
     path: str = typer.Argument(..., help="Secret path to delete"),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
-    try:
-        storage, audit_logger = get_storage_and_audit()
-
-        secret = storage.get_secret(path)
-        if not secret:
-            print_error(f"Secret not found: {path}")
-            sys.exit(1)
+    storage, audit_logger = get_storage_and_audit()
 
-        if not force:
-            confirm = typer.confirm(f"Delete {path}?")
-            if not confirm:
-                print_info("Cancelled")
-                return
+    secret = storage.get_secret(path)
+    if not secret:
+        print_error(f"Secret not found: {path}")
+        sys.exit(1)
 
-        storage.delete_secret(path)
+    if not force:
+        confirm = typer.confirm(f"Delete {path}?")
+        if not confirm:
+            print_info("Cancelled")
+            return
 
-        audit_logger.log("delete", path, success=True)
+    storage.delete_secret(path)
 
-        print_success(f"Deleted {path}")
+    audit_logger.log("delete", path, success=True)
 
-    except Exception as e:
-        audit_logger = get_audit_logger()
-        audit_logger.log("delete", path, success=False, error=str(e))
-        print_error(f"Failed to delete secret: {e}")
-        sys.exit(1)
+    print_success(f"Deleted {path}")
 
 
 @app.command()
+@_audited("history", "Failed to get history")
 def history(
     path: str = typer.Argument(..., help="Secret path"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
-    try:
-        storage, audit_logger = get_storage_and_audit()
+    storage, audit_logger = get_storage_and_audit()
 
-        versions = storage.get_history(path)
+    versions = storage.get_history(path)
 
-        audit_logger.log("history", path, success=True)
+    audit_logger.log("history", path, success=True)
 
-        if not versions:
-            print_error(f"No history found for: {path}")
-            sys.exit(1)
-
-        if json_output:
-            console.print_json(data=[v.model_dump() for v in versions])
-        else:
-            table = create_history_table(versions)
-            console.print(f"\n[bold]History for {path}[/bold]\n")
-            console.print(table)
-
-    except Exception as e:
-        audit_logger = get_audit_logger()
-        audit_logger.log("history", path, success=False, error=str(e))
-        print_error(f"Failed to get history: {e}")
+    if not versions:
+        print_error(f"No history found for: {path}")
         sys.exit(1)
 
+    if json_output:
+        print_json(_VERSION_LIST_ADAPTER.dump_python(versions))
+    else:
+        table = create_history_table(versions)
+        console.print(f"\n[bold]History for {path}[/bold]\n")
+        console.print(table)
+
 
 @app.command()
 def rollback(
@@ -265,27 +312,32 @@ def dev_start(
     try:
         storage, audit_logger = get_storage_and_audit()
 
+        (
+            db_password,
+            api_key,
+            api_secret,
+            stripe_public,
+            stripe_secret,
+            jwt_secret,
+            encryption_key,
+        ) = _urlsafe_tokens(16, 32, 32, 16, 16, 32, 32)
+
         fake_secrets = [
             ("database/host", "localhost"),
             ("database/port", "5432"),
             ("database/username", "dev_user"),
-            ("database/password", secrets_lib.token_urlsafe(16)),
-            ("api/key", secrets_lib.token_urlsafe(32)),
-            ("api/secret", secrets_lib.token_urlsafe(32)),
-            ("stripe/public_key", f"pk_test_{secrets_lib.token_urlsafe(16)}"),
-            ("stripe/secret_key", f"sk_test_{secrets_lib.token_urlsafe(16)}"),
-            ("jwt/secret", secrets_lib.token_urlsafe(32)),
-            ("encryption/key", secrets_lib.token_urlsafe(32)),
+            ("database/password", db_password),
+            ("api/key", api_key),
+            ("api/secret", api_secret),
+            ("stripe/public_key", f"pk_test_{stripe_public}"),
+            ("stripe/secret_key", f"sk_test_{stripe_secret}"),
+            ("jwt/secret", jwt_secret),
+            ("encryption/key", encryption_key),
         ]
 
-        created = 0
-        for path, value in fake_secrets[:count]:
-            try:
-                storage.set_secret(path, value, "config", ["development", "fake"])
-                created += 1
-            except Exception:
-                continue
-
+        created = len(
+            storage.set_secrets_bulk(fake_secrets[:count], "config", ["development", "fake"])
+        )
 
         audit_logger.log("dev:start", ".", success=True, metadata={"count": created})
 
@@ -310,20 +362,18 @@ def dev_export(
             print_info("No secrets to export")
             return
 
-        lines = []
-        for secret in secrets_list:
-            # Convert path to env var name (database/password -> DATABASE_PASSWORD)
-            env_name = secret.path.replace("/", "_").replace("-", "_").upper()
-            lines.append(f'{env_name}="{secret.value}"')
-
-        env_content = "\n".join(lines)
+        # Convert path to env var name (database/password -> DATABASE_PASSWORD)
+        lines = (
+            f'{_env_name(secret.path)}="{secret.value}"\n'
+            for secret in secrets_list
+        )
 
         if output_file:
-            with open(output_file, "w") as f:
-                f.write(env_content)
+            with open(output_file, "w", buffering=_EXPORT_BUFFER_SIZE) as f:
+                f.writelines(lines)
             print_success(f"Exported {len(secrets_list)} secrets to {output_file}")
         else:
-            console.print(env_content)
+            sys.stdout.writelines(lines)
 
         audit_logger.log(
             "dev:export",
@@ -349,34 +399,26 @@ def import_env(
 
         storage, audit_logger = get_storage_and_audit()
 
-        imported = 0
         with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-
-                if not line or line.startswith("#"):
-                    continue
+            content = f.read()
 
-                if "=" not in line:
-                    continue
+        entries = []
+        for match in _ENV_LINE_RE.finditer(content):
+            key, value = match.groups()
+            value = value.strip('"').strip("'")
 
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
+            if not value:
+                continue
 
-                if not value:
-                    continue
+            path = key.lower().replace("_", "/")
 
-                path = key.lower().replace("_", "/")
+            if prefix:
+                path = f"{prefix}/{path}"
 
-                if prefix:
-                    path = f"{prefix}/{path}"
+            entries.append((path, value))
 
-                try:
-                    storage.set_secret(path, value, "config", ["imported"])
-                    imported += 1
-                except Exception:
-                    continue
+        storage.set_secrets_bulk(entries, "config", ["imported"])
+        imported = len(entries)
 
         audit_logger.log(
             "import:env", file_path, success=True, metadata={"count": imported, "prefix": prefix}
@@ -394,22 +436,27 @@ def shell_env(
     prefix: Optional[str] = typer.Argument(None),
     format: str = typer.Option("bash", help="Shell format: bash, fish, powershell")
 ) -> None:
+    template = _SET_ENV_TEMPLATES.get(format)
+    if template is None:
+        print_error(f"Unsupported shell format: {format}")
+        raise typer.Exit(1)
+
     try:
         storage, audit_logger = get_storage_and_audit()
         secrets = storage.list_secrets(prefix)
 
-        for secret in secrets:
-            env_key = secret.path.upper().replace('/', '_').replace('-', '_')
-
-            if format == "bash":
-                console.print(f'export {env_key}="{secret.value}"')
-            elif format == "fish":
-                console.print(f'set -x {env_key} "{secret.value}"')
-            elif format == "powershell":
-                console.print(f'$env:{env_key}="{secret.value}"')
-            audit_logger.log(
-                    "shell_env", ".", success=True, metadata={"env_var_name": env_key}
-            )
+        env_keys = [_env_name(secret.path) for secret in secrets]
+        # Plain write: output is meant for eval, so skip rich's markup handling
+        sys.stdout.write(
+            "".join(template % (key, secret.value) for key, secret in zip(env_keys, secrets))
+        )
+
+        audit_logger.log(
+            "shell_env",
+            ".",
+            success=True,
+            metadata={"env_var_names": env_keys, "count": len(env_keys)},
+        )
 
     except Exception as e:
         print_error(f"Failed to apply env vars to shell: {e}")
@@ -421,18 +468,20 @@ def scan(
     path: str = typer.Argument(".", help="Path to scan"),
 ) -> None:
     try:
-        result = subprocess.run(
-            ["detect-secrets", "scan", path],
-            capture_output=True,
-            text=True
-        )
-        output = json.loads(result.stdout)
+        from detect_secrets import SecretsCollection
+        from detect_secrets.core.scan import get_files_to_scan
+        from detect_secrets.settings import default_settings
 
-        if not output.get("results"):
+        results = SecretsCollection()
+        with default_settings():
+            results.scan_files(*get_files_to_scan(path))
+        output = results.json()
+
+        if not output:
             print_info("No secrets detected!")
         else:
             print_warning("Potential secrets found:")
-            console.print(output["results"])
+            console.print(output)
 
     except Exception as e:
         print_error(f"Failed to scan codebase for potential secrets: {e}")
@@ -445,25 +494,25 @@ def unset_env(
     tag: Optional[str] = typer.Option(None, help="Filter by tag"),
     format: str = typer.Option("bash", help="Shell format: bash, fish, powershell")
 ) -> None:
+    template = _UNSET_ENV_TEMPLATES.get(format)
+    if template is None:
+        print_error(f"Unsupported shell format: {format}")
+        raise typer.Exit(1)
+
     try:
         storage, audit_logger = get_storage_and_audit()
-        secrets = storage.list_secrets(prefix)
-
-        if tag:
-            secrets = [s for s in secrets if tag in s.tags]
+        # Only names are printed, so values stay encrypted
+        secrets = storage.list_secrets(prefix, decrypt_values=False, tag=tag)
 
-        for secret in secrets:
-            env_key = secret.path.upper().replace('/', '_').replace('-', '_')
+        env_keys = [_env_name(secret.path) for secret in secrets]
+        sys.stdout.write("".join(template % key for key in env_keys))
 
-            if format == "bash":
-                console.print(f'unset {env_key};')
-            elif format == "fish":
-                console.print(f'set -e {env_key};')
-            elif format == "powershell":
-                console.print(f'Remove-Item Env:{env_key};')
-            audit_logger.log(
-                    "unset_env", ".", success=True, metadata={"env_var_name": env_key}
-            )
+        audit_logger.log(
+            "unset_env",
+            ".",
+            success=True,
+            metadata={"env_var_names": env_keys, "count": len(env_keys)},
+        )
 
     except Exception as e:
         print_error(f"Failed to unset vars in shell: {e}")
@@ -488,18 +537,22 @@ def branch(
                 console.print("No branches found")
                 return
 
+            from rich.table import Table
+
             table = Table(show_header=True, header_style="bold cyan")
             table.add_column("Branch")
             table.add_column("Commits")
             table.add_column("Created")
 
+            commit_counts = storage.get_branch_commit_counts()
+
             for b in branches:
                 marker = "* " if b.name == current else "  "
-                commits = len(storage.get_commit_history(b.name, limit=1000))
+                commits = min(commit_counts.get(b.name, 0), 1000)
                 table.add_row(
                     f"{marker}{b.name}",
-                    str(commits) if b.head_commit_id else "0",
-                    b.created_at.strftime("%Y-%m-%d %H:%M"),
+                    str(commits),
+                    b.created_at.isoformat(" ", "minutes"),
                 )
 
             console.print(table)
@@ -587,11 +640,15 @@ def log(
             console.print(f"No commits on branch '{branch_name}'")
             return
 
-        for c in commits:
-            console.print(f"[yellow]commit {c.id}[/yellow]")
-            console.print(f"Author: {c.author}")
-            console.print(f"Date:   {c.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-            console.print(f"\n    {c.message}\n")
+        console.print(
+            "\n".join(
+                f"[yellow]commit {c.id}[/yellow]\n"
+                f"Author: {c.author}\n"
+                f"Date:   {c.timestamp.isoformat(' ', 'seconds')}\n"
+                f"\n    {c.message}\n"
+                for c in commits
+            )
+        )
 
     except Exception as e:
         print_error(f"Log failed: {e}")
@@ -613,22 +670,21 @@ def status() -> None:
             console.print("[green]Nothing to commit, working tree clean[/green]")
             return
 
+        lines = []
         if status["added"]:
-            console.print("[green]New secrets:[/green]")
-            for path in status["added"]:
-                console.print(f"  [green]+ {path}[/green]")
+            lines.append("[green]New secrets:[/green]")
+            lines.extend(f"  [green]+ {path}[/green]" for path in status["added"])
 
         if status["modified"]:
-            console.print("[yellow]Modified secrets:[/yellow]")
-            for path in status["modified"]:
-                console.print(f"  [yellow]M {path}[/yellow]")
+            lines.append("[yellow]Modified secrets:[/yellow]")
+            lines.extend(f"  [yellow]M {path}[/yellow]" for path in status["modified"])
 
         if status["deleted"]:
-            console.print("[red]Deleted secrets:[/red]")
-            for path in status["deleted"]:
-                console.print(f"  [red]- {path}[/red]")
+            lines.append("[red]Deleted secrets:[/red]")
+            lines.extend(f"  [red]- {path}[/red]" for path in status["deleted"])
 
-        console.print(f"\nRun 'crux commit -m \"message\"' to commit changes")
+        lines.append(f"\nRun 'crux commit -m \"message\"' to commit changes")
+        console.print("\n".join(lines))
 
     except Exception as e:
         print_error(f"Status failed: {e}")
@@ -651,17 +707,10 @@ def diff(
                 console.print("No changes")
                 return
 
-            if status["added"]:
-                for path in status["added"]:
-                    console.print(f"[green]+ {path}: <new>[/green]")
-
-            if status["modified"]:
-                for path in status["modified"]:
-                    console.print(f"[yellow]M {path}: <modified>[/yellow]")
-
-            if status["deleted"]:
-                for path in status["deleted"]:
-                    console.print(f"[red]- {path}: <deleted>[/red]")
+            lines = [f"[green]+ {path}: <new>[/green]" for path in status["added"]]
+            lines.extend(f"[yellow]M {path}: <modified>[/yellow]" for path in status["modified"])
+            lines.extend(f"[red]- {path}: <deleted>[/red]" for path in status["deleted"])
+            console.print("\n".join(lines))
             return
 
         if not commit2:
@@ -674,17 +723,7 @@ def diff(
             console.print("No differences")
             return
 
-        for entry in diff_entries:
-            if entry.status == "added":
-                console.print(f"[green]+ {entry.path}[/green]")
-                console.print(f"  [green]{entry.new_value}[/green]")
-            elif entry.status == "modified":
-                console.print(f"[yellow]M {entry.path}[/yellow]")
-                console.print(f"  [red]- {entry.old_value}[/red]")
-                console.print(f"  [green]+ {entry.new_value}[/green]")
-            elif entry.status == "deleted":
-                console.print(f"[red]- {entry.path}[/red]")
-                console.print(f"  [red]{entry.old_value}[/red]")
+        console.print(format_diff_entries(diff_entries))
 
     except Exception as e:
         print_error(f"Diff failed: {e}")
@@ -727,10 +766,7 @@ def merge(
 
         if conflicts and not force:
             console.print("[red]Merge conflicts detected:[/red]\n")
-            for conflict in conflicts:
-                console.print(f"[yellow]{conflict.path}:[/yellow]")
-                console.print(f"  Current:  {conflict.current_value}")
-                console.print(f"  Incoming: {conflict.incoming_value}\n")
+            console.print(format_merge_conflicts(conflicts))
             console.print("Resolve conflicts manually or use --force to accept incoming changes")
             sys.exit(1)
 
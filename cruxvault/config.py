@@ -1,10 +1,30 @@
+import functools
 import os
 import yaml
 from pathlib import Path
 from typing import Optional
 
 from cruxvault.models import AppConfig
-from cruxvault.utils.console import print_error
+
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> AppConfig:
+    # Keyed on the file's stat, so every ConfigManager shares one parse until the file changes
+    try:
+        with open(config_path, "r") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+            return AppConfig(**data) if data else AppConfig()
+    except Exception:
+        return AppConfig()
+
+
+def invalidate_config_cache() -> None:
+    _parse_config.cache_clear()
 
 
 class ConfigManager:
@@ -14,6 +34,8 @@ class ConfigManager:
 
     def __init__(self, config_dir: str = DEFAULT_CONFIG_DIR) -> None:
         self.config_dir = config_dir
+        self._crux_root = None
+        self._config_path = None
         # self.config_path = os.path.join(config_dir, self.DEFAULT_CONFIG_FILE)
 
     def initialize(self) -> None:
@@ -29,41 +51,51 @@ class ConfigManager:
         return self.get_config_path()
 
     def find_crux_root(self) -> Path:
+        # Only a found root is remembered; a miss is retried since `init` may create it
+        if self._crux_root is not None:
+            return self._crux_root
+
         current = Path.cwd()
         while current != current.parent:
             unified_dir = current / self.config_dir
             if unified_dir.exists():
+                self._crux_root = current
                 return current
             current = current.parent
         return None
         # raise FileNotFoundError(f"Not in a cruxvault project (no {self.config_dir} found)")
     
     def get_config_path(self) -> Path:
-        root = self.find_crux_root()
-        if root is None:
-            return None
-        return root / self.config_dir / self.DEFAULT_CONFIG_FILE
+        if self._config_path is None:
+            root = self.find_crux_root()
+            if root is None:
+                return None
+            self._config_path = root / self.config_dir / self.DEFAULT_CONFIG_FILE
+        return self._config_path
 
     def load_config(self) -> AppConfig:
-        if self.config_path is None:
+        config_path = self.config_path
+        if config_path is None:
+            from cruxvault.utils.console import print_error
+
             raise SystemExit(print_error(f"Not in a CruxVault project (no {self.config_dir} found). "
             "Please run `crux init` before any other command!"))
 
-        if not os.path.exists(self.config_path):
-            return AppConfig()
-
         try:
-            with open(self.config_path, "r") as f:
-                data = yaml.safe_load(f)
-                return AppConfig(**data) if data else AppConfig()
-        except Exception:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             return AppConfig()
 
+        return _parse_config(str(config_path), st.st_mtime_ns, st.st_size)
+
     def save_config(self, config: AppConfig) -> None:
+        invalidate_config_cache()
         # Path(self.config_dir).mkdir(parents=True, exist_ok=True)
 
         with open(self.config_path, "w") as f:
-            yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                config.model_dump(), f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+            )
 
     def get_storage_path(self) -> str:
         config = self.load_config()
@@ -91,7 +123,7 @@ class ConfigManager:
         return "main"
 
     def set_current_branch(self, branch: str) -> None:
+        # find_crux_root only returns a root whose config dir exists, so no mkdir is needed
         git_config_path = os.path.join(self.find_crux_root(), self.config_dir, "HEAD")
-        Path(os.path.join(self.find_crux_root(), self.config_dir)).mkdir(parents=True, exist_ok=True)
         with open(git_config_path, "w") as f:
             f.write(branch)
@@ -1,8 +1,8 @@
 import base64
+import binascii
 import os
-from typing import Optional
+from typing import Iterable, Optional
 
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
@@ -21,28 +21,68 @@ class Encryptor:
         self.aesgcm = AESGCM(master_key)
 
     def encrypt(self, plaintext: str) -> str:
+        try:
+            combined = self.encrypt_bytes(plaintext.encode("utf-8"))
+            return binascii.b2a_base64(combined, newline=False).decode("ascii")
+
+        except EncryptionError:
+            raise
+        except Exception as e:
+            raise EncryptionError(f"Encryption failed: {e}") from e
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        # Raw nonce + ciphertext + tag, for callers that already hold bytes
         try:
             nonce = os.urandom(12)
+            return nonce + self.aesgcm.encrypt(nonce, data, None)
 
-            plaintext_bytes = plaintext.encode("utf-8")
-            ciphertext = self.aesgcm.encrypt(nonce, plaintext_bytes, None)
+        except Exception as e:
+            raise EncryptionError(f"Encryption failed: {e}") from e
 
-            combined = nonce + ciphertext
-            return base64.b64encode(combined).decode("utf-8")
+    def encrypt_many(self, plaintexts: Iterable[str]) -> list[str]:
+        # Bulk writes: one urandom call for every nonce, one try block, pre-bound callables
+        plaintexts = list(plaintexts)
+        encrypt = self.aesgcm.encrypt
+        b2a = binascii.b2a_base64
+        try:
+            nonces = os.urandom(12 * len(plaintexts))
+            encrypted = []
+            for i, plaintext in enumerate(plaintexts):
+                nonce = nonces[i * 12:i * 12 + 12]
+                combined = nonce + encrypt(nonce, plaintext.encode("utf-8"), None)
+                encrypted.append(b2a(combined, newline=False).decode("ascii"))
+            return encrypted
 
         except Exception as e:
             raise EncryptionError(f"Encryption failed: {e}") from e
 
     def decrypt(self, encrypted: str) -> str:
         try:
-            combined = base64.b64decode(encrypted.encode("utf-8"))
+            return self.decrypt_bytes(binascii.a2b_base64(encrypted)).decode("utf-8")
 
+        except EncryptionError:
+            raise
+        except Exception as e:
+            raise EncryptionError(f"Decryption failed: {e}") from e
+
+    def decrypt_bytes(self, combined: bytes) -> bytes:
+        try:
             # Split nonce and ciphertext
-            nonce = combined[:12]
-            ciphertext = combined[12:]
+            return self.aesgcm.decrypt(combined[:12], combined[12:], None)
 
-            plaintext_bytes = self.aesgcm.decrypt(nonce, ciphertext, None)
-            return plaintext_bytes.decode("utf-8")
+        except Exception as e:
+            raise EncryptionError(f"Decryption failed: {e}") from e
+
+    def decrypt_many(self, values: Iterable[str]) -> list[str]:
+        # One try block and pre-bound callables for the whole batch, e.g. listing a vault
+        decrypt = self.aesgcm.decrypt
+        a2b = binascii.a2b_base64
+        try:
+            plaintexts = []
+            for encrypted in values:
+                combined = a2b(encrypted)
+                plaintexts.append(decrypt(combined[:12], combined[12:], None).decode("utf-8"))
+            return plaintexts
 
         except Exception as e:
             raise EncryptionError(f"Decryption failed: {e}") from e
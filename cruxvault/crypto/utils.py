@@ -1,19 +1,15 @@
+import functools
 import os
-import keyring
 
 from cruxvault.crypto.encryption import Encryptor
 
 KEYRING_SERVICE = "cruxvault-cli"
 KEYRING_USERNAME = "master-key"
 
-def get_or_create_master_key() -> bytes:
-    try:
-        key_string = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
-        if key_string:
-            return Encryptor.string_to_key(key_string)
-    except Exception:
-        pass
+_CPUINFO_PATH = "/proc/cpuinfo"
 
+def get_or_create_master_key() -> bytes:
+    # An exported key wins and skips the keyring (a D-Bus/Keychain round-trip) entirely
     env_key = os.getenv("UNIFIED_MASTER_KEY")
     if env_key:
         try:
@@ -21,15 +17,51 @@ def get_or_create_master_key() -> bytes:
         except Exception:
             pass
 
+    return _keyring_master_key()
+
+
+@functools.lru_cache(maxsize=1)
+def _keyring_master_key() -> bytes:
+    import keyring
+
+    try:
+        key_string = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        if key_string:
+            return Encryptor.string_to_key(key_string)
+    except Exception:
+        pass
+
     key = Encryptor.generate_key()
 
     # Try to save to keyring
     try:
         keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, Encryptor.key_to_string(key))
     except Exception:
+        from cruxvault.utils.console import print_warning
+
         print_warning(
             "Could not save master key to system keychain. "
             f"Set UNIFIED_MASTER_KEY environment variable to: {Encryptor.key_to_string(key)}"
         )
 
     return key
+
+
+def aes_acceleration() -> dict:
+    # OpenSSL only takes its AES-GCM fast path when the CPU advertises AES and carry-less
+    # multiply (AES-NI/PCLMULQDQ on x86, aes/pmull on ARMv8); None means we couldn't tell
+    from cryptography.hazmat.backends.openssl.backend import backend
+
+    info = {"openssl_version": backend.openssl_version_text(), "aes": None, "clmul": None}
+    try:
+        with open(_CPUINFO_PATH, "r") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    flags = value.split()
+                    info["aes"] = "aes" in flags
+                    info["clmul"] = "pclmulqdq" in flags or "pmull" in flags
+                    break
+    except OSError:
+        pass
+    return info
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from cruxvault.models import Secret, SecretVersion
 
@@ -27,6 +27,26 @@ class StorageBackend(ABC):
         """
         pass
 
+    def set_secrets_bulk(
+        self,
+        items: list[tuple[str, str]],
+        secret_type: str = "secret",
+        tags: Optional[list[str]] = None,
+    ) -> list[Secret]:
+        """Store or update several secrets at once.
+
+        Backends should override this to write all items in a single transaction.
+
+        Args:
+            items: (path, value) pairs
+            secret_type: Type applied to newly created secrets
+            tags: Optional tags applied to every secret
+
+        Returns:
+            Created/updated Secrets, in input order
+        """
+        return [self.set_secret(path, value, secret_type, tags) for path, value in items]
+
     @abstractmethod
     def get_secret(self, path: str) -> Optional[Secret]:
         """Retrieve a secret by path.
@@ -39,18 +59,63 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_secrets(self, paths: Iterable[str]) -> dict[str, Secret]:
+        """Retrieve several secrets by path.
+
+        Backends should override this to fetch them in a single round trip.
+
+        Args:
+            paths: Secret paths
+
+        Returns:
+            Mapping of path to secret, in request order, for the paths that exist
+        """
+        secrets = {}
+        for path in paths:
+            secret = self.get_secret(path)
+            if secret is not None:
+                secrets[path] = secret
+        return secrets
+
     @abstractmethod
-    def list_secrets(self, prefix: Optional[str] = None) -> list[Secret]:
-        """List all secrets, optionally filtered by prefix.
+    def list_secrets(
+        self,
+        prefix: Optional[str] = None,
+        decrypt_values: bool = True,
+        tag: Optional[str] = None,
+    ) -> list[Secret]:
+        """List all secrets, optionally filtered by prefix and tag.
 
         Args:
             prefix: Optional path prefix filter
+            decrypt_values: If False, values are left encrypted and masked
+            tag: Optional tag the secrets must carry
 
         Returns:
             List of secrets
         """
         pass
 
+    def iter_secrets(
+        self,
+        prefix: Optional[str] = None,
+        decrypt_values: bool = True,
+        tag: Optional[str] = None,
+    ) -> Iterator[Secret]:
+        """Iterate over secrets like list_secrets, without holding them all at once.
+
+        Backends should override this to stream rows from the underlying store.
+
+        Args:
+            prefix: Optional path prefix filter
+            decrypt_values: If False, values are left encrypted and masked
+            tag: Optional tag the secrets must carry
+
+        Yields:
+            Secrets, ordered by path
+        """
+        yield from self.list_secrets(prefix, decrypt_values, tag)
+
     @abstractmethod
     def delete_secret(self, path: str) -> bool:
         """Delete a secret.
@@ -63,6 +128,19 @@ class StorageBackend(ABC):
         """
         pass
 
+    def delete_secrets(self, paths: Iterable[str]) -> int:
+        """Delete several secrets and their history.
+
+        Backends should override this to delete them in a single transaction.
+
+        Args:
+            paths: Secret paths
+
+        Returns:
+            Number of secrets deleted; paths that don't exist are skipped
+        """
+        return sum(self.delete_secret(path) for path in dict.fromkeys(paths))
+
     @abstractmethod
     def get_history(self, path: str) -> list[SecretVersion]:
         """Get version history for a secret.
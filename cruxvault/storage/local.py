@@ -1,11 +1,32 @@
 import re
 import os
+import functools
+import sys
 import json
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from sqlalchemy import create_engine, select
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import (
+    Integer,
+    and_,
+    bindparam,
+    create_engine,
+    delete,
+    event,
+    exists,
+    insert,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, sessionmaker
 
 from cruxvault.crypto.encryption import Encryptor
@@ -30,9 +51,346 @@ from cruxvault.storage.models import (
     SecretVersionModel,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Reads only: writes keep json.dumps so stored tag strings, which commit/diff compare, don't change.
+# Callers skip the parse for the "[]" / "{}" that nearly every row holds.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Stands in for values that callers asked not to decrypt
+_HIDDEN_VALUE = "•" * 8
+
+# Tags are stored as a JSON array; match one without loading and decoding every row
+_HAS_TAG = text(
+    "EXISTS (SELECT 1 FROM json_each("
+    "CASE WHEN json_valid(secrets.tags) THEN secrets.tags ELSE '[]' END"
+    ") WHERE json_each.value = :tag)"
+)
+
+# Column projection for reads: plain Row tuples instead of ORM objects in the identity map
+_SECRET_COLUMNS = (
+    SecretModel.path,
+    SecretModel.encrypted_value,
+    SecretModel.type,
+    SecretModel.version,
+    SecretModel.created_at,
+    SecretModel.updated_at,
+    SecretModel.tags,
+    SecretModel.meta_data,
+)
+
+# Lookups on the hot paths are built once and bound per call, skipping statement construction
+_SELECT_SECRET_ROW = select(*_SECRET_COLUMNS).where(SecretModel.path == bindparam("path"))
+_SELECT_SECRET_ROWS = select(*_SECRET_COLUMNS).where(
+    SecretModel.path.in_(bindparam("paths", expanding=True))
+)
+_SELECT_ENCRYPTED_VALUE = select(SecretModel.encrypted_value).where(
+    SecretModel.path == bindparam("path")
+)
+_SELECT_SECRET_BY_PATH = select(SecretModel).where(SecretModel.path == bindparam("path"))
+_SELECT_CURRENT_VERSION = select(
+    SecretModel.encrypted_value, SecretModel.version, SecretModel.updated_at
+).where(SecretModel.path == bindparam("path"))
+_SELECT_VERSION_HISTORY = (
+    select(
+        SecretVersionModel.encrypted_value,
+        SecretVersionModel.version,
+        SecretVersionModel.created_at,
+        SecretVersionModel.created_by,
+    )
+    .where(SecretVersionModel.path == bindparam("path"))
+    .order_by(SecretVersionModel.version.desc())
+)
+_SELECT_VERSION = (
+    select(SecretVersionModel)
+    .where(SecretVersionModel.path == bindparam("path"))
+    .where(SecretVersionModel.version == bindparam("version"))
+)
+_SELECT_BRANCH_BY_NAME = select(BranchModel).where(BranchModel.name == bindparam("name"))
+_SELECT_BRANCHES = select(BranchModel.name, BranchModel.head_commit_id, BranchModel.created_at)
+_SELECT_BRANCH_ROW = _SELECT_BRANCHES.where(BranchModel.name == bindparam("name"))
+_SELECT_BRANCH_HEAD = select(BranchModel.head_commit_id).where(
+    BranchModel.name == bindparam("name")
+)
+_DELETE_SECRET = delete(SecretModel).where(SecretModel.path == bindparam("path"))
+_DELETE_SECRET_VERSIONS = delete(SecretVersionModel).where(
+    SecretVersionModel.path == bindparam("path")
+)
+_UPDATE_SECRET = update(SecretModel).where(SecretModel.path == bindparam("b_path"))
+_DELETE_SECRETS = delete(SecretModel).where(
+    SecretModel.path.in_(bindparam("paths", expanding=True))
+)
+_DELETE_SECRETS_VERSIONS = delete(SecretVersionModel).where(
+    SecretVersionModel.path.in_(bindparam("paths", expanding=True))
+)
+
+# Walks parent links from a branch head in one recursive CTE, newest first
+_commit_chain = (
+    select(
+        CommitModel.id,
+        CommitModel.parent_id,
+        CommitModel.message,
+        CommitModel.author,
+        CommitModel.timestamp,
+        CommitModel.branch,
+        literal(1).label("depth"),
+    )
+    .where(CommitModel.id == bindparam("head"))
+    .cte("commit_chain", recursive=True)
+)
+_commit_chain = _commit_chain.union_all(
+    select(
+        CommitModel.id,
+        CommitModel.parent_id,
+        CommitModel.message,
+        CommitModel.author,
+        CommitModel.timestamp,
+        CommitModel.branch,
+        _commit_chain.c.depth + 1,
+    )
+    .join(_commit_chain, CommitModel.id == _commit_chain.c.parent_id)
+    .where(_commit_chain.c.depth < bindparam("limit"))
+)
+_SELECT_COMMIT_CHAIN = (
+    select(
+        _commit_chain.c.id,
+        _commit_chain.c.parent_id,
+        _commit_chain.c.message,
+        _commit_chain.c.author,
+        _commit_chain.c.timestamp,
+        _commit_chain.c.branch,
+    )
+    .where(_commit_chain.c.depth <= bindparam("limit"))
+    .order_by(_commit_chain.c.depth)
+)
+
+# Snapshot comparisons run in SQL so only changed paths leave the database (and get decrypted).
+# SQLite before 3.39 has no FULL OUTER JOIN, so the diff is two LEFT JOINs glued by UNION ALL.
+_old_snapshot = CommitSecretModel.__table__.alias("old_snapshot")
+_new_snapshot = CommitSecretModel.__table__.alias("new_snapshot")
+_DIFF_COMMITS = union_all(
+    select(
+        _new_snapshot.c.path.label("path"),
+        _old_snapshot.c.encrypted_value.label("old_value"),
+        _new_snapshot.c.encrypted_value.label("new_value"),
+        literal(0).label("removed"),
+    )
+    .select_from(
+        _new_snapshot.outerjoin(
+            _old_snapshot,
+            and_(
+                _old_snapshot.c.commit_id == bindparam("old_id"),
+                _old_snapshot.c.path == _new_snapshot.c.path,
+            ),
+        )
+    )
+    .where(_new_snapshot.c.commit_id == bindparam("new_id"))
+    .where(
+        or_(
+            _old_snapshot.c.path.is_(None),
+            _old_snapshot.c.encrypted_value != _new_snapshot.c.encrypted_value,
+        )
+    ),
+    select(
+        _old_snapshot.c.path,
+        _old_snapshot.c.encrypted_value,
+        null(),
+        literal(1),
+    )
+    .select_from(
+        _old_snapshot.outerjoin(
+            _new_snapshot,
+            and_(
+                _new_snapshot.c.commit_id == bindparam("new_id"),
+                _new_snapshot.c.path == _old_snapshot.c.path,
+            ),
+        )
+    )
+    .where(_old_snapshot.c.commit_id == bindparam("old_id"))
+    .where(_new_snapshot.c.path.is_(None)),
+).order_by(literal_column("removed"), literal_column("path"))
+_MERGE_CONFLICTS = (
+    select(
+        _new_snapshot.c.path,
+        _old_snapshot.c.encrypted_value.label("old_value"),
+        _new_snapshot.c.encrypted_value.label("new_value"),
+    )
+    .join(_old_snapshot, _old_snapshot.c.path == _new_snapshot.c.path)
+    .where(_old_snapshot.c.commit_id == bindparam("old_id"))
+    .where(_new_snapshot.c.commit_id == bindparam("new_id"))
+    .where(_old_snapshot.c.encrypted_value != _new_snapshot.c.encrypted_value)
+    .order_by(_new_snapshot.c.path)
+)
+
+# Working set vs. the branch head, labelled added/modified/deleted; a NULL head marks all added
+_STATUS_CHANGES = union_all(
+    select(SecretModel.path.label("path"), literal("added").label("status")).where(
+        ~exists().where(
+            CommitSecretModel.commit_id == bindparam("head"),
+            CommitSecretModel.path == SecretModel.path,
+        )
+    ),
+    select(SecretModel.path, literal("modified"))
+    .join(
+        CommitSecretModel,
+        and_(
+            CommitSecretModel.commit_id == bindparam("head"),
+            CommitSecretModel.path == SecretModel.path,
+        ),
+    )
+    .where(CommitSecretModel.encrypted_value != SecretModel.encrypted_value),
+    select(CommitSecretModel.path, literal("deleted"))
+    .where(CommitSecretModel.commit_id == bindparam("head"))
+    .where(~exists().where(SecretModel.path == CommitSecretModel.path)),
+).order_by(literal_column("path"))
+
+# Commits snapshot and restore the working set with INSERT ... SELECT, never loading rows.
+# Run on session.connection(): Session.execute() would treat the params as ORM bulk rows.
+_SNAPSHOT_SECRETS = insert(CommitSecretModel).from_select(
+    ["commit_id", "path", "encrypted_value", "type", "tags"],
+    select(
+        bindparam("commit_id", type_=Integer),
+        SecretModel.path,
+        SecretModel.encrypted_value,
+        SecretModel.type,
+        SecretModel.tags,
+    ),
+)
+_RESTORE_SECRETS = insert(SecretModel).from_select(
+    ["path", "encrypted_value", "type", "tags", "version", "created_at", "updated_at", "meta_data"],
+    select(
+        CommitSecretModel.path,
+        CommitSecretModel.encrypted_value,
+        CommitSecretModel.type,
+        CommitSecretModel.tags,
+        literal(1),
+        bindparam("now", type_=SecretModel.created_at.type),
+        bindparam("now", type_=SecretModel.updated_at.type),
+        literal("{}"),
+    ).where(CommitSecretModel.commit_id == bindparam("commit_id")),
+)
+
+# set_secret upserts with INSERT ... ON CONFLICT ... RETURNING, which needs SQLite 3.35+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Built once; set_secret only binds parameters. Copies the current row (if any) into history.
+_ARCHIVE_CURRENT_VERSION = insert(SecretVersionModel).from_select(
+    ["path", "encrypted_value", "version", "created_at", "created_by"],
+    select(
+        SecretModel.path,
+        SecretModel.encrypted_value,
+        SecretModel.version,
+        SecretModel.updated_at,
+        bindparam("created_by"),
+    ).where(SecretModel.path == bindparam("path")),
+)
+
+_UPSERT_SECRET = sqlite_insert(SecretModel).values(
+    path=bindparam("path"),
+    encrypted_value=bindparam("encrypted_value"),
+    type=bindparam("type"),
+    version=1,
+    tags=bindparam("tags"),
+    created_at=bindparam("now"),
+    updated_at=bindparam("now"),
+)
+_UPSERT_SECRET = _UPSERT_SECRET.on_conflict_do_update(
+    index_elements=[SecretModel.path],
+    set_={
+        "encrypted_value": _UPSERT_SECRET.excluded.encrypted_value,
+        "version": SecretModel.version + 1,
+        "updated_at": _UPSERT_SECRET.excluded.updated_at,
+        "tags": _UPSERT_SECRET.excluded.tags,
+    },
+).returning(
+    SecretModel.path,
+    SecretModel.type,
+    SecretModel.version,
+    SecretModel.created_at,
+    SecretModel.updated_at,
+)
+
+_utcnow = datetime.utcnow
+
+# create_all skips indexes on tables that already exist, so indexes added after a vault was
+# created are back-filled whenever it is opened
+_BACKFILLED_INDEX_MODELS = (SecretVersionModel, CommitSecretModel)
+_SELECT_SCHEMA_NAMES = text("SELECT name FROM sqlite_master WHERE type IN ('table', 'index')")
+
+# Rows fetched, decrypted and hydrated per step while streaming secrets
+_STREAM_BATCH_SIZE = 256
+
+# ${other/path} references inside secret values
+_VAR_REF_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Paths per IN (...) in the bulk get/set/delete methods, under SQLite's bound-parameter limit
+_BULK_LOOKUP_CHUNK = 500
+
+_TUNING_PRAGMAS = (
+    # Only take effect while the database is still empty, and must come before WAL is enabled
+    "PRAGMA page_size=8192",
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+
+def _apply_tuning_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in _TUNING_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _secret_from_row(row, value: str) -> Secret:
+    path, _, secret_type, version, created_at, updated_at, tags, meta_data = row
+    return Secret(
+        path=path,
+        value=value,
+        type=SecretType(secret_type),
+        version=version,
+        created_at=created_at,
+        updated_at=updated_at,
+        tags=_json_loads(tags) if tags and tags != "[]" else [],
+        metadata=_json_loads(meta_data) if meta_data and meta_data != "{}" else {},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _list_statement(prefixed: bool, bounded: bool, tagged: bool):
+    # One prebuilt select per filter shape; callers only bind lower/upper/tag
+    stmt = select(*_SECRET_COLUMNS)
+    if prefixed:
+        stmt = stmt.where(SecretModel.path >= bindparam("lower"))
+    if bounded:
+        stmt = stmt.where(SecretModel.path < bindparam("upper"))
+    if tagged:
+        stmt = stmt.where(_HAS_TAG)
+    return stmt.order_by(SecretModel.path)
+
+
+def _list_query(prefix: Optional[str], tag: Optional[str] = None) -> tuple:
+    # A range on the indexed path column (prefix <= path < successor of prefix) is an
+    # index seek; LIKE 'prefix%' is case-insensitive in SQLite and scans the whole table
+    params = {}
+    if prefix:
+        params["lower"] = prefix
+        last = ord(prefix[-1])
+        if last != sys.maxunicode:
+            params["upper"] = prefix[:-1] + chr(last + 1)
+    if tag:
+        params["tag"] = tag
+    return _list_statement(bool(prefix), "upper" in params, bool(tag)), params
+
 
 class SQLiteStorage(StorageBackend):
-    def __init__(self, db_path: str, encryptor: Encryptor) -> None:
+    def __init__(self, db_path: str, encryptor: Encryptor, tune_pragmas: bool = True) -> None:
         self.db_path = db_path
         self.encryptor = encryptor
 
@@ -41,215 +399,328 @@ class SQLiteStorage(StorageBackend):
             Path(db_dir).mkdir(parents=True, exist_ok=True)
 
         self.engine = create_engine(f"sqlite:///{db_path}")
+        if tune_pragmas:
+            event.listen(self.engine, "connect", _apply_tuning_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        self._backfill_indexes()
+
+    def _backfill_indexes(self) -> None:
+        with self.engine.begin() as conn:
+            existing = set(conn.execute(_SELECT_SCHEMA_NAMES).scalars())
+            for model in _BACKFILLED_INDEX_MODELS:
+                if model.__tablename__ not in existing:
+                    continue
+                for index in model.__table__.indexes:
+                    if index.name not in existing:
+                        index.create(bind=conn)
 
     def initialize(self) -> None:
         Base.metadata.create_all(bind=self.engine)
 
-    def _expand_variables(self, value: str, path: str, visited: set = None) -> str:
-        if visited is None:
-            visited = set()
-
+    def _expand_variables(
+        self,
+        value: str,
+        path: str,
+        visited: frozenset = frozenset(),
+        cache: Optional[dict[str, str]] = None,
+    ) -> str:
         if path in visited:
             raise ValueError(f"Circular reference detected: {path}")
 
-        visited.add(path)
+        if "${" not in value:
+            return value
+
+        visited = visited | {path}
+        # Expanded value per referenced path, shared across the whole expansion
+        if cache is None:
+            cache = {}
 
         def replace_var(match):
             var_name = match.group(1)
+            if var_name in cache:
+                return cache[var_name]
             try:
-                var_secret = self.get_secret(var_name)
+                with self.engine.connect() as conn:
+                    encrypted_value = conn.execute(
+                        _SELECT_ENCRYPTED_VALUE, {"path": var_name}
+                    ).scalar_one()
                 # Recursively expand the referenced value
-                return self._expand_variables(var_secret.value, var_name, visited.copy())
-            except:
+                expanded = self._expand_variables(
+                    self.encryptor.decrypt(encrypted_value), var_name, visited, cache
+                )
+            except Exception:
                 return match.group(0)  # Leave unchanged if not found
+            cache[var_name] = expanded
+            return expanded
 
-        return re.sub(r'\$\{([^}]+)\}', replace_var, value)
+        return _VAR_REF_RE.sub(replace_var, value)
 
     def set_secret(
         self, path: str, value: str, secret_type: str = "secret", tags: Optional[list[str]] = None
     ) -> Secret:
         tags = tags or []
-
-        with self.SessionLocal() as session:
-            stmt = select(SecretModel).where(SecretModel.path == path)
-            existing = session.execute(stmt).scalar_one_or_none()
-
-            # Encrypt value
-            encrypted_value = self.encryptor.encrypt(value)
-
-            if existing:
-                version_record = SecretVersionModel(
-                    path=existing.path,
-                    encrypted_value=existing.encrypted_value,
-                    version=existing.version,
-                    created_at=existing.updated_at,
-                    created_by=os.getenv("USER", "unknown"),
-                )
-                session.add(version_record)
-
-                existing.encrypted_value = encrypted_value
-                existing.version += 1
-                existing.updated_at = datetime.utcnow()
-                existing.tags = json.dumps(tags)
-                session.commit()
-
-                return Secret(
-                    path=existing.path,
-                    value=value,
-                    type=SecretType(existing.type),
-                    version=existing.version,
-                    created_at=existing.created_at,
-                    updated_at=existing.updated_at,
-                    tags=tags,
-                )
-            else:
-                new_secret = SecretModel(
-                    path=path,
-                    encrypted_value=encrypted_value,
-                    type=secret_type,
-                    version=1,
-                    tags=json.dumps(tags),
+        if not _SQLITE_HAS_RETURNING:
+            return self.set_secrets_bulk([(path, value)], secret_type, tags)[0]
+
+        params = {
+            "path": path,
+            "encrypted_value": self.encryptor.encrypt(value),
+            "type": secret_type,
+            "tags": json.dumps(tags),
+            "now": _utcnow(),
+            "created_by": os.getenv("USER", "unknown"),
+        }
+        with self.engine.begin() as conn:
+            conn.execute(_ARCHIVE_CURRENT_VERSION, params)
+            row = conn.execute(_UPSERT_SECRET, params).one()
+
+        return Secret(
+            path=row.path,
+            value=value,
+            type=SecretType(row.type),
+            version=row.version,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            tags=tags,
+        )
+
+    def set_secrets_bulk(
+        self,
+        items: list[tuple[str, str]],
+        secret_type: str = "secret",
+        tags: Optional[list[str]] = None,
+    ) -> list[Secret]:
+        tags = tags or []
+        encrypted_values = self.encryptor.encrypt_many(value for _, value in items)
+        # One timestamp, author and tag encoding for the whole batch
+        now = _utcnow()
+        created_by = os.getenv("USER", "unknown")
+        tags_json = json.dumps(tags)
+
+        with self.engine.begin() as conn:
+            # Look up every existing row up front instead of one SELECT per item
+            paths = list({path for path, _ in items})
+            current: dict[str, dict] = {}
+            for start in range(0, len(paths), _BULK_LOOKUP_CHUNK):
+                rows = conn.execute(
+                    _SELECT_SECRET_ROWS, {"paths": paths[start:start + _BULK_LOOKUP_CHUNK]}
                 )
-                session.add(new_secret)
-                session.commit()
+                current.update((row.path, row._asdict()) for row in rows)
+            existing_paths = set(current)
 
-                return Secret(
-                    path=new_secret.path,
-                    value=value,
-                    type=SecretType(new_secret.type),
-                    version=new_secret.version,
-                    created_at=new_secret.created_at,
-                    updated_at=new_secret.updated_at,
-                    tags=tags,
+            # Work out every history row and final secret row here, then write each table
+            # with one executemany instead of ORM unit-of-work bookkeeping per row
+            archived = []
+            secrets = []
+            for (path, value), encrypted_value in zip(items, encrypted_values):
+                row = current.get(path)
+                if row is None:
+                    row = {"path": path, "type": secret_type, "version": 1, "created_at": now}
+                else:
+                    archived.append(
+                        {
+                            "path": path,
+                            "encrypted_value": row["encrypted_value"],
+                            "version": row["version"],
+                            "created_at": row["updated_at"],
+                            "created_by": created_by,
+                        }
+                    )
+                    row = {**row, "version": row["version"] + 1}
+                row.update(encrypted_value=encrypted_value, tags=tags_json, updated_at=now)
+                current[path] = row
+                secrets.append(
+                    Secret(
+                        path=path,
+                        value=value,
+                        type=SecretType(row["type"]),
+                        version=row["version"],
+                        created_at=row["created_at"],
+                        updated_at=now,
+                        tags=tags,
+                    )
                 )
 
-    def get_secret(self, path: str) -> Optional[Secret]:
-        with self.SessionLocal() as session:
-            stmt = select(SecretModel).where(SecretModel.path == path)
-            secret_model = session.execute(stmt).scalar_one_or_none()
-
-            if not secret_model:
-                return None
+            if archived:
+                conn.execute(insert(SecretVersionModel), archived)
+            inserted = [row for path, row in current.items() if path not in existing_paths]
+            if inserted:
+                conn.execute(insert(SecretModel), inserted)
+            updated = [
+                {
+                    "b_path": path,
+                    "encrypted_value": row["encrypted_value"],
+                    "version": row["version"],
+                    "updated_at": now,
+                    "tags": tags_json,
+                }
+                for path, row in current.items()
+                if path in existing_paths
+            ]
+            if updated:
+                conn.execute(_UPDATE_SECRET, updated)
 
-            decrypted_value = self.encryptor.decrypt(secret_model.encrypted_value)
+        return secrets
 
-            expanded_value = self._expand_variables(decrypted_value, path)
+    def get_secret(self, path: str) -> Optional[Secret]:
+        with self.engine.connect() as conn:
+            row = conn.execute(_SELECT_SECRET_ROW, {"path": path}).one_or_none()
 
-            return Secret(
-                path=secret_model.path,
-                value=expanded_value,
-                type=SecretType(secret_model.type),
-                version=secret_model.version,
-                created_at=secret_model.created_at,
-                updated_at=secret_model.updated_at,
-                tags=json.loads(secret_model.tags) if secret_model.tags else [],
-                metadata=json.loads(secret_model.meta_data) if secret_model.meta_data else {},
-            )
+        if not row:
+            return None
 
-    def list_secrets(self, prefix: Optional[str] = None) -> list[Secret]:
-        with self.SessionLocal() as session:
-            stmt = select(SecretModel)
-            if prefix:
-                stmt = stmt.where(SecretModel.path.like(f"{prefix}%"))
-            stmt = stmt.order_by(SecretModel.path)
+        decrypted_value = self.encryptor.decrypt(row.encrypted_value)
 
-            results = session.execute(stmt).scalars().all()
+        expanded_value = self._expand_variables(decrypted_value, path)
 
-            secrets = []
-            for secret_model in results:
-                decrypted_value = self.encryptor.decrypt(secret_model.encrypted_value)
+        return _secret_from_row(row, expanded_value)
 
-                secrets.append(
-                    Secret(
-                        path=secret_model.path,
-                        value=decrypted_value,
-                        type=SecretType(secret_model.type),
-                        version=secret_model.version,
-                        created_at=secret_model.created_at,
-                        updated_at=secret_model.updated_at,
-                        tags=json.loads(secret_model.tags) if secret_model.tags else [],
-                        metadata=(
-                            json.loads(secret_model.meta_data) if secret_model.meta_data else {}
-                        ),
+    def get_secrets(self, paths: Iterable[str]) -> dict[str, Secret]:
+        paths = list(dict.fromkeys(paths))
+        rows = []
+        with self.engine.connect() as conn:
+            for start in range(0, len(paths), _BULK_LOOKUP_CHUNK):
+                rows.extend(
+                    conn.execute(
+                        _SELECT_SECRET_ROWS, {"paths": paths[start:start + _BULK_LOOKUP_CHUNK]}
                     )
                 )
 
-            return secrets
+        values = self.encryptor.decrypt_many(row.encrypted_value for row in rows)
+        found = {
+            row.path: _secret_from_row(row, self._expand_variables(value, row.path))
+            for row, value in zip(rows, values)
+        }
+        return {path: found[path] for path in paths if path in found}
+
+    def list_secrets(
+        self,
+        prefix: Optional[str] = None,
+        decrypt_values: bool = True,
+        tag: Optional[str] = None,
+    ) -> list[Secret]:
+        return list(self.iter_secrets(prefix, decrypt_values, tag))
+
+    def iter_secrets(
+        self,
+        prefix: Optional[str] = None,
+        decrypt_values: bool = True,
+        tag: Optional[str] = None,
+    ) -> Iterator[Secret]:
+        stmt, params = _list_query(prefix, tag)
+
+        with self.engine.connect() as conn:
+            result = conn.execution_options(yield_per=_STREAM_BATCH_SIZE).execute(stmt, params)
+            for rows in result.partitions():
+                if decrypt_values:
+                    values = self.encryptor.decrypt_many(row.encrypted_value for row in rows)
+                else:
+                    values = [_HIDDEN_VALUE] * len(rows)
+
+                for row, value in zip(rows, values):
+                    yield _secret_from_row(row, value)
+
+    def list_secrets_as_dicts(
+        self, prefix: Optional[str] = None, decrypt_values: bool = True
+    ) -> list[dict]:
+        # Same shape as Secret.model_dump(), built straight from the rows for JSON output
+        stmt, params = _list_query(prefix)
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt, params).all()
+
+        if decrypt_values:
+            values = self.encryptor.decrypt_many(row[1] for row in rows)
+        else:
+            values = [_HIDDEN_VALUE] * len(rows)
+
+        return [
+            {
+                "path": path,
+                "value": value,
+                "type": secret_type,
+                "version": version,
+                "created_at": created_at.isoformat(),
+                "updated_at": updated_at.isoformat(),
+                "tags": _json_loads(tags) if tags and tags != "[]" else [],
+                "metadata": _json_loads(meta_data) if meta_data and meta_data != "{}" else {},
+            }
+            for (
+                path,
+                encrypted_value,
+                secret_type,
+                version,
+                created_at,
+                updated_at,
+                tags,
+                meta_data,
+            ), value in zip(rows, values)
+        ]
 
     def delete_secret(self, path: str) -> bool:
-        with self.SessionLocal() as session:
-            stmt = select(SecretModel).where(SecretModel.path == path)
-            secret = session.execute(stmt).scalar_one_or_none()
-
-            if not secret:
+        with self.engine.begin() as conn:
+            deleted = conn.execute(_DELETE_SECRET, {"path": path}).rowcount
+            if not deleted:
                 return False
 
-            version_stmt = select(SecretVersionModel).where(SecretVersionModel.path == path)
-            versions = session.execute(version_stmt).scalars().all()
-            for version in versions:
-                session.delete(version)
-
-            session.delete(secret)
-            session.commit()
+            conn.execute(_DELETE_SECRET_VERSIONS, {"path": path})
             return True
 
+    def delete_secrets(self, paths: Iterable[str]) -> int:
+        paths = list(dict.fromkeys(paths))
+        deleted = 0
+        with self.engine.begin() as conn:
+            for start in range(0, len(paths), _BULK_LOOKUP_CHUNK):
+                params = {"paths": paths[start:start + _BULK_LOOKUP_CHUNK]}
+                deleted += conn.execute(_DELETE_SECRETS, params).rowcount
+                conn.execute(_DELETE_SECRETS_VERSIONS, params)
+        return deleted
+
     def get_history(self, path: str) -> list[SecretVersion]:
-        with self.SessionLocal() as session:
-            stmt = select(SecretModel).where(SecretModel.path == path)
-            current = session.execute(stmt).scalar_one_or_none()
+        with self.engine.connect() as conn:
+            current = conn.execute(_SELECT_CURRENT_VERSION, {"path": path}).one_or_none()
 
             if not current:
                 return []
 
-            stmt = (
-                select(SecretVersionModel)
-                .where(SecretVersionModel.path == path)
-                .order_by(SecretVersionModel.version.desc())
-            )
-            history = session.execute(stmt).scalars().all()
+            history = conn.execute(_SELECT_VERSION_HISTORY, {"path": path}).all()
 
-            versions = []
+        values = self.encryptor.decrypt_many(
+            [current.encrypted_value] + [row.encrypted_value for row in history]
+        )
 
-            decrypted_value = self.encryptor.decrypt(current.encrypted_value)
+        versions = [
+            SecretVersion(
+                path=path,
+                value=values[0],
+                version=current.version,
+                created_at=current.updated_at,
+                created_by=os.getenv("USER", "unknown"),
+            )
+        ]
+        for row, value in zip(history, values[1:]):
             versions.append(
                 SecretVersion(
-                    path=current.path,
-                    value=decrypted_value,
-                    version=current.version,
-                    created_at=current.updated_at,
-                    created_by=os.getenv("USER", "unknown"),
+                    path=path,
+                    value=value,
+                    version=row.version,
+                    created_at=row.created_at,
+                    created_by=row.created_by,
                 )
             )
 
-            for version_model in history:
-                decrypted_value = self.encryptor.decrypt(version_model.encrypted_value)
-                versions.append(
-                    SecretVersion(
-                        path=version_model.path,
-                        value=decrypted_value,
-                        version=version_model.version,
-                        created_at=version_model.created_at,
-                        created_by=version_model.created_by,
-                    )
-                )
-
-            return versions
+        return versions
 
     def rollback(self, path: str, version: int) -> Secret:
         with self.SessionLocal() as session:
-            stmt = (
-                select(SecretVersionModel)
-                .where(SecretVersionModel.path == path)
-                .where(SecretVersionModel.version == version)
-            )
-            version_model = session.execute(stmt).scalar_one_or_none()
+            version_model = session.execute(
+                _SELECT_VERSION, {"path": path, "version": version}
+            ).scalar_one_or_none()
 
             if not version_model:
                 raise ValueError(f"Version {version} not found for {path}")
 
-            stmt = select(SecretModel).where(SecretModel.path == path)
-            current = session.execute(stmt).scalar_one_or_none()
+            current = session.execute(_SELECT_SECRET_BY_PATH, {"path": path}).scalar_one_or_none()
 
             if not current:
                 raise ValueError(f"Secret {path} not found")
@@ -266,7 +737,7 @@ class SQLiteStorage(StorageBackend):
             # Rollback to old version (but increment version number)
             current.encrypted_value = version_model.encrypted_value
             current.version += 1
-            current.updated_at = datetime.utcnow()
+            current.updated_at = _utcnow()
             session.commit()
 
             decrypted_value = self.encryptor.decrypt(current.encrypted_value)
@@ -277,7 +748,7 @@ class SQLiteStorage(StorageBackend):
                 version=current.version,
                 created_at=current.created_at,
                 updated_at=current.updated_at,
-                tags=json.loads(current.tags) if current.tags else [],
+                tags=_json_loads(current.tags) if current.tags else [],
             )
 
 
@@ -302,16 +773,16 @@ class SQLiteStorage(StorageBackend):
 
     def create_branch(self, name: str, from_branch: Optional[str] = None) -> Branch:
         with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == name)
-            existing = session.execute(stmt).scalar_one_or_none()
+            existing = session.execute(_SELECT_BRANCH_BY_NAME, {"name": name}).scalar_one_or_none()
             if existing:
                 raise ValueError(f"Branch '{name}' already exists")
 
             # Get head commit from source branch if specified
             head_commit_id = None
             if from_branch:
-                stmt = select(BranchModel).where(BranchModel.name == from_branch)
-                source_branch = session.execute(stmt).scalar_one_or_none()
+                source_branch = session.execute(
+                    _SELECT_BRANCH_BY_NAME, {"name": from_branch}
+                ).scalar_one_or_none()
                 if not source_branch:
                     raise ValueError(f"Branch '{from_branch}' not found")
                 head_commit_id = source_branch.head_commit_id
@@ -326,13 +797,12 @@ class SQLiteStorage(StorageBackend):
 
 
     def list_branches(self) -> list[Branch]:
-        with self.SessionLocal() as session:
-            stmt = select(BranchModel)
-            branches = session.execute(stmt).scalars().all()
-            return [
-                Branch(name=b.name, head_commit_id=b.head_commit_id, created_at=b.created_at)
-                for b in branches
-            ]
+        with self.engine.connect() as conn:
+            rows = conn.execute(_SELECT_BRANCHES).all()
+        return [
+            Branch(name=name, head_commit_id=head_commit_id, created_at=created_at)
+            for name, head_commit_id, created_at in rows
+        ]
 
 
     def delete_branch(self, name: str) -> bool:
@@ -340,8 +810,7 @@ class SQLiteStorage(StorageBackend):
             if name == "main":
                 raise ValueError("Cannot delete main branch")
 
-            stmt = select(BranchModel).where(BranchModel.name == name)
-            branch = session.execute(stmt).scalar_one_or_none()
+            branch = session.execute(_SELECT_BRANCH_BY_NAME, {"name": name}).scalar_one_or_none()
             if not branch:
                 return False
 
@@ -351,14 +820,11 @@ class SQLiteStorage(StorageBackend):
 
 
     def get_branch(self, name: str) -> Optional[Branch]:
-        with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == name)
-            branch = session.execute(stmt).scalar_one_or_none()
-            if not branch:
-                return None
-            return Branch(
-                name=branch.name, head_commit_id=branch.head_commit_id, created_at=branch.created_at
-            )
+        with self.engine.connect() as conn:
+            row = conn.execute(_SELECT_BRANCH_ROW, {"name": name}).one_or_none()
+        if not row:
+            return None
+        return Branch(name=row.name, head_commit_id=row.head_commit_id, created_at=row.created_at)
 
 
     def commit(self, branch_name: str, message: str, author: Optional[str] = None) -> Commit:
@@ -366,8 +832,9 @@ class SQLiteStorage(StorageBackend):
             author = os.getenv("USER", "unknown")
 
         with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == branch_name)
-            branch = session.execute(stmt).scalar_one_or_none()
+            branch = session.execute(
+                _SELECT_BRANCH_BY_NAME, {"name": branch_name}
+            ).scalar_one_or_none()
             if not branch:
                 raise ValueError(f"Branch '{branch_name}' not found")
 
@@ -375,25 +842,14 @@ class SQLiteStorage(StorageBackend):
                 parent_id=branch.head_commit_id,
                 message=message,
                 author=author,
-                timestamp=datetime.utcnow(),
+                timestamp=_utcnow(),
                 branch=branch_name,
             )
             session.add(commit)
             session.flush()  # Get commit ID
 
             # Snapshot all current secrets
-            stmt = select(SecretModel)
-            secrets = session.execute(stmt).scalars().all()
-
-            for secret in secrets:
-                commit_secret = CommitSecretModel(
-                    commit_id=commit.id,
-                    path=secret.path,
-                    encrypted_value=secret.encrypted_value,
-                    type=secret.type,
-                    tags=secret.tags,
-                )
-                session.add(commit_secret)
+            session.connection().execute(_SNAPSHOT_SECRETS, {"commit_id": commit.id})
 
             branch.head_commit_id = commit.id
             session.commit()
@@ -410,152 +866,113 @@ class SQLiteStorage(StorageBackend):
 
     def get_commit_history(self, branch_name: str, limit: int = 10) -> list[Commit]:
         with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == branch_name)
-            branch = session.execute(stmt).scalar_one_or_none()
+            branch = session.execute(
+                _SELECT_BRANCH_BY_NAME, {"name": branch_name}
+            ).scalar_one_or_none()
             if not branch:
                 raise ValueError(f"Branch '{branch_name}' not found")
 
             if not branch.head_commit_id:
                 return []
 
-            commits = []
-            current_commit_id = branch.head_commit_id
-
-            while current_commit_id and len(commits) < limit:
-                stmt = select(CommitModel).where(CommitModel.id == current_commit_id)
-                commit = session.execute(stmt).scalar_one_or_none()
-                if not commit:
+            rows = session.execute(
+                _SELECT_COMMIT_CHAIN, {"head": branch.head_commit_id, "limit": limit}
+            ).all()
+
+        return [
+            Commit(
+                id=row.id,
+                parent_id=row.parent_id,
+                message=row.message,
+                author=row.author,
+                timestamp=row.timestamp,
+                branch=row.branch,
+            )
+            for row in rows
+        ]
+
+
+    def get_branch_commit_counts(self) -> dict[str, int]:
+        with self.engine.connect() as conn:
+            parents = dict(conn.execute(select(CommitModel.id, CommitModel.parent_id)).all())
+            heads = conn.execute(select(BranchModel.name, BranchModel.head_commit_id)).all()
+
+        # Length of each commit's ancestry chain, shared between branches
+        depths = {None: 0}
+        counts = {}
+        for name, head_commit_id in heads:
+            chain = []
+            current = head_commit_id
+            while current not in depths:
+                if current not in parents:
+                    depths[current] = 0
                     break
+                chain.append(current)
+                current = parents[current]
 
-                commits.append(
-                    Commit(
-                        id=commit.id,
-                        parent_id=commit.parent_id,
-                        message=commit.message,
-                        author=commit.author,
-                        timestamp=commit.timestamp,
-                        branch=commit.branch,
-                    )
-                )
-                current_commit_id = commit.parent_id
+            depth = depths[current]
+            for commit_id in reversed(chain):
+                depth += 1
+                depths[commit_id] = depth
+
+            counts[name] = depths[head_commit_id]
 
-            return commits
+        return counts
 
+    def _restore_commit(self, session: Session, commit_id: int) -> None:
+        session.connection().execute(
+            _RESTORE_SECRETS, {"commit_id": commit_id, "now": _utcnow()}
+        )
 
     def checkout_branch(self, branch_name: str) -> None:
         with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == branch_name)
-            branch = session.execute(stmt).scalar_one_or_none()
+            branch = session.execute(
+                _SELECT_BRANCH_BY_NAME, {"name": branch_name}
+            ).scalar_one_or_none()
             if not branch:
                 raise ValueError(f"Branch '{branch_name}' not found")
 
-            for secret in session.execute(select(SecretModel)).scalars().all():
-                session.delete(secret)
+            session.execute(delete(SecretModel))
 
             # Restore from commit if branch has commits
             if branch.head_commit_id:
-                stmt = select(CommitSecretModel).where(
-                    CommitSecretModel.commit_id == branch.head_commit_id
-                )
-                commit_secrets = session.execute(stmt).scalars().all()
-
-                for cs in commit_secrets:
-                    secret = SecretModel(
-                        path=cs.path,
-                        encrypted_value=cs.encrypted_value,
-                        type=cs.type,
-                        tags=cs.tags,
-                        version=1,
-                    )
-                    session.add(secret)
+                self._restore_commit(session, branch.head_commit_id)
 
             session.commit()
 
 
     def get_status(self, branch_name: str) -> dict:
-        with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == branch_name)
-            branch = session.execute(stmt).scalar_one_or_none()
-            if not branch or not branch.head_commit_id:
-                stmt = select(SecretModel)
-                current_secrets = {s.path: s for s in session.execute(stmt).scalars().all()}
-                return {
-                    "added": list(current_secrets.keys()),
-                    "modified": [],
-                    "deleted": [],
-                }
-
-            stmt = select(CommitSecretModel).where(
-                CommitSecretModel.commit_id == branch.head_commit_id
-            )
-            committed = {cs.path: cs for cs in session.execute(stmt).scalars().all()}
-
-            stmt = select(SecretModel)
-            current_secrets = {s.path: s for s in session.execute(stmt).scalars().all()}
-
-            added = []
-            modified = []
-            deleted = []
+        with self.engine.connect() as conn:
+            head = conn.execute(_SELECT_BRANCH_HEAD, {"name": branch_name}).scalar()
+            rows = conn.execute(_STATUS_CHANGES, {"head": head}).all()
 
-            # Find added and modified
-            for path, secret in current_secrets.items():
-                if path not in committed:
-                    added.append(path)
-                elif secret.encrypted_value != committed[path].encrypted_value:
-                    modified.append(path)
-
-            # Find deleted
-            for path in committed:
-                if path not in current_secrets:
-                    deleted.append(path)
-
-            return {"added": added, "modified": modified, "deleted": deleted}
+        status = {"added": [], "modified": [], "deleted": []}
+        for path, change in rows:
+            status[change].append(path)
+        return status
 
 
     def diff_commits(self, commit1_id: int, commit2_id: int) -> list[DiffEntry]:
-        with self.SessionLocal() as session:
-            stmt1 = select(CommitSecretModel).where(CommitSecretModel.commit_id == commit1_id)
-            secrets1 = {cs.path: cs for cs in session.execute(stmt1).scalars().all()}
-
-            stmt2 = select(CommitSecretModel).where(CommitSecretModel.commit_id == commit2_id)
-            secrets2 = {cs.path: cs for cs in session.execute(stmt2).scalars().all()}
-
-            diff = []
-
-            # Find added and modified
-            for path, cs2 in secrets2.items():
-                if path not in secrets1:
-                    diff.append(
-                        DiffEntry(
-                            path=path,
-                            status="added",
-                            old_value=None,
-                            new_value=self.encryptor.decrypt(cs2.encrypted_value),
-                        )
-                    )
-                elif cs2.encrypted_value != secrets1[path].encrypted_value:
-                    diff.append(
-                        DiffEntry(
-                            path=path,
-                            status="modified",
-                            old_value=self.encryptor.decrypt(secrets1[path].encrypted_value),
-                            new_value=self.encryptor.decrypt(cs2.encrypted_value),
-                        )
-                    )
-
-            # Find deleted
-            for path in secrets1:
-                if path not in secrets2:
-                    diff.append(
-                        DiffEntry(
-                            path=path,
-                            status="deleted",
-                            old_value=self.encryptor.decrypt(secrets1[path].encrypted_value),
-                            new_value=None,
-                        )
-                    )
-
-            return diff
+        with self.engine.connect() as conn:
+            changes = conn.execute(
+                _DIFF_COMMITS, {"old_id": commit1_id, "new_id": commit2_id}
+            ).all()
+
+        # Decrypt every changed value in one batch, then hand them back out in order
+        values = iter(
+            self.encryptor.decrypt_many(
+                [ct for _, old, new, _ in changes for ct in (old, new) if ct is not None]
+            )
+        )
+        return [
+            DiffEntry(
+                path=path,
+                status="deleted" if removed else "added" if old is None else "modified",
+                old_value=None if old is None else next(values),
+                new_value=None if new is None else next(values),
+            )
+            for path, old, new, removed in changes
+        ]
 
 
     def rollback_to_commit(self, branch_name: str, commit_id: int) -> None:
@@ -565,29 +982,17 @@ class SQLiteStorage(StorageBackend):
             if not commit:
                 raise ValueError(f"Commit {commit_id} not found")
 
-            stmt = select(BranchModel).where(BranchModel.name == branch_name)
-            branch = session.execute(stmt).scalar_one_or_none()
+            branch = session.execute(
+                _SELECT_BRANCH_BY_NAME, {"name": branch_name}
+            ).scalar_one_or_none()
             if not branch:
                 raise ValueError(f"Branch '{branch_name}' not found")
 
             branch.head_commit_id = commit_id
             
             # Restore secrets from commit
-            for secret in session.execute(select(SecretModel)).scalars().all():
-                session.delete(secret)
-
-            stmt = select(CommitSecretModel).where(CommitSecretModel.commit_id == commit_id)
-            commit_secrets = session.execute(stmt).scalars().all()
-
-            for cs in commit_secrets:
-                secret = SecretModel(
-                    path=cs.path,
-                    encrypted_value=cs.encrypted_value,
-                    type=cs.type,
-                    tags=cs.tags,
-                    version=1,
-                )
-                session.add(secret)
+            session.execute(delete(SecretModel))
+            self._restore_commit(session, commit_id)
 
             session.commit()
 
@@ -596,64 +1001,43 @@ class SQLiteStorage(StorageBackend):
         self, target_branch: str, source_branch: str
     ) -> tuple[bool, list[MergeConflict]]:
         with self.SessionLocal() as session:
-            stmt = select(BranchModel).where(BranchModel.name == target_branch)
-            target = session.execute(stmt).scalar_one_or_none()
+            target = session.execute(
+                _SELECT_BRANCH_BY_NAME, {"name": target_branch}
+            ).scalar_one_or_none()
             if not target:
                 raise ValueError(f"Branch '{target_branch}' not found")
 
-            stmt = select(BranchModel).where(BranchModel.name == source_branch)
-            source = session.execute(stmt).scalar_one_or_none()
+            source = session.execute(
+                _SELECT_BRANCH_BY_NAME, {"name": source_branch}
+            ).scalar_one_or_none()
             if not source:
                 raise ValueError(f"Branch '{source_branch}' not found")
 
             if not source.head_commit_id:
                 return True, []  # Nothing to merge
 
-            # Get secrets from both branches
-            target_secrets = {}
-            if target.head_commit_id:
-                stmt = select(CommitSecretModel).where(
-                    CommitSecretModel.commit_id == target.head_commit_id
-                )
-                target_secrets = {cs.path: cs for cs in session.execute(stmt).scalars().all()}
-
-            stmt = select(CommitSecretModel).where(
-                CommitSecretModel.commit_id == source.head_commit_id
+            # Paths both heads carry with different values; a branch without commits has none
+            rows = session.execute(
+                _MERGE_CONFLICTS,
+                {"old_id": target.head_commit_id, "new_id": source.head_commit_id},
+            ).all()
+            values = self.encryptor.decrypt_many(
+                ct for _, old, new in rows for ct in (old, new)
             )
-            source_secrets = {cs.path: cs for cs in session.execute(stmt).scalars().all()}
-
-            # Detect conflicts
-            conflicts = []
-            for path, source_cs in source_secrets.items():
-                if path in target_secrets:
-                    if source_cs.encrypted_value != target_secrets[path].encrypted_value:
-                        conflicts.append(
-                            MergeConflict(
-                                path=path,
-                                current_value=self.encryptor.decrypt(
-                                    target_secrets[path].encrypted_value
-                                ),
-                                incoming_value=self.encryptor.decrypt(source_cs.encrypted_value),
-                            )
-                        )
+            conflicts = [
+                MergeConflict(
+                    path=path, current_value=values[2 * i], incoming_value=values[2 * i + 1]
+                )
+                for i, (path, _, _) in enumerate(rows)
+            ]
 
             if conflicts:
                 return False, conflicts
 
             # No conflicts, perform merge
             # Update all secrets to source state
-            for secret in session.execute(select(SecretModel)).scalars().all():
-                session.delete(secret)
-
-            for path, cs in source_secrets.items():
-                secret = SecretModel(
-                    path=cs.path,
-                    encrypted_value=cs.encrypted_value,
-                    type=cs.type,
-                    tags=cs.tags,
-                    version=1,
-                )
-                session.add(secret)
+            session.execute(delete(SecretModel))
+            self._restore_commit(session, source.head_commit_id)
 
             session.commit()
             return True, []
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, Integer, String, Text
+from sqlalchemy import JSON, Boolean, DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -27,9 +27,11 @@ class SecretModel(Base):
 
 class SecretVersionModel(Base):
     __tablename__ = "secret_versions"
+    # Serves path lookups plus the version-ordered history/rollback queries without a sort
+    __table_args__ = (Index("ix_secret_versions_path_version", "path", "version"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    path: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    path: Mapped[str] = mapped_column(String(500), nullable=False)
     encrypted_value: Mapped[str] = mapped_column(Text, nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
@@ -73,9 +75,11 @@ class CommitModel(Base):
 
 class CommitSecretModel(Base):
     __tablename__ = "commit_secrets"
+    # Serves the per-commit snapshot reads (status, diff, checkout, merge) in path order
+    __table_args__ = (Index("ix_commit_secrets_commit_id_path", "commit_id", "path"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    commit_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    commit_id: Mapped[int] = mapped_column(Integer, nullable=False)
     path: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     encrypted_value: Mapped[str] = mapped_column(Text, nullable=False)
     type: Mapped[str] = mapped_column(String(50), nullable=False, default="secret")
@@ -1,11 +1,20 @@
+import sys
+from operator import itemgetter
 from typing import Any
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+_HIDDEN_VALUE = "•" * 8
+
 def print_success(message: str) -> None:
     console.print(f"[green]✓[/green] {message}")
 
@@ -14,10 +23,6 @@ def print_error(message: str) -> None:
     console.print(f"[red]✗[/red] {message}", style="red")
 
 
-def print_error(message: str) -> None:
-    console.print(f"[red]✗[/red] {message}", style="red")
-
-
 def print_warning(message: str) -> None:
     console.print(f"[yellow]![/yellow] {message}", style="yellow")
 
@@ -26,6 +31,18 @@ def print_info(message: str) -> None:
     console.print(f"[blue]ℹ[/blue] {message}")
 
 
+def print_json(data: Any) -> None:
+    if orjson is None:
+        console.print_json(data=data)
+        return
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(
+        orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    sys.stdout.flush()
+
+
 def create_secrets_table(
     secrets: list[Any], show_values: bool = False, show_versions: bool = False
 ) -> Table:
@@ -45,26 +62,19 @@ def create_secrets_table(
     table.add_column("Tags", style="magenta")
     table.add_column("Updated", style="dim")
 
+    # Column shape is fixed per table, so pick the cells once rather than branching per row
+    cells = itemgetter(0, 1, 2, 3, 4, 5) if show_versions else itemgetter(0, 1, 3, 4, 5)
+
     for secret in secrets:
-        row = [
+        row = (
             secret.path,
             secret.type.value,
-        ]
-
-        if show_versions:
-            row.append(str(secret.version))
-
-        if show_values:
-            row.append(secret.value)
-        else:
-            row.append("•" * 8)  # Hidden value
-
-        row.extend([
-            ", ".join(secret.tags) if secret.tags else "",
-            secret.updated_at.strftime("%Y-%m-%d %H:%M"),
-        ])
-
-        table.add_row(*row)
+            str(secret.version),
+            secret.value if show_values else _HIDDEN_VALUE,
+            ", ".join(secret.tags or ()),
+            secret.updated_at.isoformat(" ", "minutes"),
+        )
+        table.add_row(*cells(row))
 
     return table
 
@@ -83,7 +93,7 @@ def create_history_table(versions: list[Any]) -> Table:
 
         table.add_row(
             str(version.version),
-            version.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            version.created_at.isoformat(" ", "seconds"),
             version.created_by or "unknown",
             preview,
         )
@@ -91,6 +101,32 @@ def create_history_table(versions: list[Any]) -> Table:
     return table
 
 
+def format_diff_entries(entries: list[Any]) -> str:
+    lines = []
+    for entry in entries:
+        if entry.status == "added":
+            lines.append(f"[green]+ {entry.path}[/green]")
+            lines.append(f"  [green]{entry.new_value}[/green]")
+        elif entry.status == "modified":
+            lines.append(f"[yellow]M {entry.path}[/yellow]")
+            lines.append(f"  [red]- {entry.old_value}[/red]")
+            lines.append(f"  [green]+ {entry.new_value}[/green]")
+        elif entry.status == "deleted":
+            lines.append(f"[red]- {entry.path}[/red]")
+            lines.append(f"  [red]{entry.old_value}[/red]")
+
+    return "\n".join(lines)
+
+
+def format_merge_conflicts(conflicts: list[Any]) -> str:
+    return "\n".join(
+        f"[yellow]{conflict.path}:[/yellow]\n"
+        f"  Current:  {conflict.current_value}\n"
+        f"  Incoming: {conflict.incoming_value}\n"
+        for conflict in conflicts
+    )
+
+
 def print_panel(title: str, content: str, style: str = "blue") -> None:
     panel = Panel(content, title=title, border_style=style)
     console.print(panel)
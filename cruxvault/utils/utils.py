@@ -1,8 +1,36 @@
+import atexit
+import functools
+import os
+from typing import TYPE_CHECKING
+
 from cruxvault.config import ConfigManager
 from cruxvault.audit.logger import AuditLogger
-from cruxvault.storage.local import SQLiteStorage
-from cruxvault.crypto.encryption import Encryptor
-from cruxvault.crypto.utils import get_or_create_master_key
+from cruxvault.models import AppConfig
+
+# SQLAlchemy, cryptography and keyring are imported when storage is first built,
+# so commands like --help or log don't pay for them
+if TYPE_CHECKING:
+    from cruxvault.storage.local import SQLiteStorage
+
+
+# Storages handed out by _cached_storage_and_audit, disposed at exit or on reset
+_open_storages: list["SQLiteStorage"] = []
+
+
+def _close_cached_storage() -> None:
+    while _open_storages:
+        _open_storages.pop().close()
+
+
+atexit.register(_close_cached_storage)
+
+
+def _audit_log_reads(config: AppConfig) -> bool:
+    # CRUXVAULT_AUDIT_READS overrides audit.log_reads from config.yaml
+    override = os.getenv("CRUXVAULT_AUDIT_READS")
+    if override is None:
+        return config.audit.log_reads
+    return override not in ("", "0")
 
 
 def get_audit_logger() -> AuditLogger:
@@ -13,11 +41,16 @@ def get_audit_logger() -> AuditLogger:
     audit_logger = AuditLogger(
         audit_path,
         enabled=config.audit.enabled,
-        log_reads=config.audit.log_reads,
+        log_reads=_audit_log_reads(config),
+        buffered=True,
     )
     return audit_logger
 
-def get_storage(config_manager: ConfigManager) -> SQLiteStorage:
+def get_storage(config_manager: ConfigManager) -> "SQLiteStorage":
+    from cruxvault.crypto.encryption import Encryptor
+    from cruxvault.crypto.utils import get_or_create_master_key
+    from cruxvault.storage.local import SQLiteStorage
+
     config = config_manager.load_config()
 
     master_key = get_or_create_master_key()
@@ -26,7 +59,30 @@ def get_storage(config_manager: ConfigManager) -> SQLiteStorage:
     storage_path = config_manager.get_storage_path()
     return SQLiteStorage(storage_path, encryptor)
 
-def get_storage_and_audit() -> tuple[SQLiteStorage, AuditLogger]:
+def get_storage_and_audit(tune_sqlite: bool = True) -> tuple["SQLiteStorage", AuditLogger]:
+    config_manager = ConfigManager()
+    # Resolve (and report) a missing project before touching the cache
+    config = config_manager.load_config()
+    config_path = str(config_manager.config_path)
+    try:
+        config_mtime = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        config_mtime = 0
+    # Resolved per call so a changed CRUXVAULT_AUDIT_READS is picked up by long-lived processes
+    log_reads = _audit_log_reads(config)
+    return _cached_storage_and_audit(config_path, config_mtime, tune_sqlite, log_reads)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_storage_and_audit(
+    config_path: str, config_mtime: int, tune_sqlite: bool, log_reads: bool
+) -> tuple["SQLiteStorage", AuditLogger]:
+    from cruxvault.crypto.encryption import Encryptor
+    from cruxvault.crypto.utils import get_or_create_master_key
+    from cruxvault.storage.local import SQLiteStorage
+
+    # Keyed on the project's config file and its mtime, so a different project or an
+    # edited config.yaml gets fresh handles
     config_manager = ConfigManager()
     config = config_manager.load_config()
 
@@ -34,15 +90,20 @@ def get_storage_and_audit() -> tuple[SQLiteStorage, AuditLogger]:
     encryptor = Encryptor(master_key)
 
     storage_path = config_manager.get_storage_path()
-    storage = SQLiteStorage(storage_path, encryptor)
+    storage = SQLiteStorage(storage_path, encryptor, tune_pragmas=tune_sqlite)
+    _open_storages.append(storage)
 
     audit_path = config_manager.get_audit_path()
     audit_logger = AuditLogger(
         audit_path,
         enabled=config.audit.enabled,
-        log_reads=config.audit.log_reads,
+        log_reads=log_reads,
+        buffered=True,
     )
 
     return storage, audit_logger
 
 
+def reset_storage_cache() -> None:
+    _cached_storage_and_audit.cache_clear()
+    _close_cached_storage()
@@ -138,19 +138,21 @@ def demo_practical_usage():
     crux.set("app/db_user", "myapp")
     crux.set("app/db_password", "secret123")
     
+    db = crux.mget(["app/db_user", "app/db_password", "app/db_host", "app/db_port"])
     db_conn = (
-        f"postgresql://{crux.get('app/db_user')}:"
-        f"{crux.get('app/db_password')}@"
-        f"{crux.get('app/db_host')}:"
-        f"{crux.get('app/db_port')}/myapp"
+        f"postgresql://{db['app/db_user']}:"
+        f"{db['app/db_password']}@"
+        f"{db['app/db_host']}:"
+        f"{db['app/db_port']}/myapp"
     )
     print(f"Connection string: {db_conn}")
     
     print("\n2. Loading all secrets into dictionary:")
+    values = crux.mget([secret['path'] for secret in crux.list(prefix="app/")])
     secrets_dict = {}
-    for secret in crux.list(prefix="app/"):
-        key = secret['path'].replace('app/', '').upper()
-        secrets_dict[key] = crux.get(secret['path'])
+    for path, value in values.items():
+        key = path.replace('app/', '').upper()
+        secrets_dict[key] = value
     
     print(f"Loaded {len(secrets_dict)} secrets:")
     for key in secrets_dict:
@@ -175,11 +177,11 @@ def cleanup():
     
     print("\nDeleting all demo secrets...")
     secrets = crux.list()
-    deleted = 0
-    for secret in secrets:
-        if secret['path'].startswith('demo/') or secret['path'].startswith('app/') or secret['path'].startswith('config/'):
-            crux.delete(secret['path'])
-            deleted += 1
+    paths = [
+        secret['path'] for secret in secrets
+        if secret['path'].startswith(('demo/', 'app/', 'config/'))
+    ]
+    deleted = crux.mdelete(paths)
     
     print(f"✓ Deleted {deleted} demo secrets")
 
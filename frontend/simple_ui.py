@@ -1,3 +1,4 @@
+import bisect
 import os
 import streamlit as st
 import pandas as pd
@@ -7,6 +8,14 @@ from pathlib import Path
 from datetime import datetime, timedelta
 
 import cruxvault as crux
+from cruxvault.audit.logger import read_last_lines
+from cruxvault.config import ConfigManager
+from cruxvault.crypto.utils import aes_acceleration
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 st.set_page_config(
     page_title="CruxVault Dashboard",
@@ -52,42 +61,79 @@ with st.sidebar:
     st.markdown("---")
     st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
 
+def _file_state(*paths):
+    # (mtime, size) per file, used as a cache key so a rerun only reloads what changed
+    state = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            state.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            state.append(None)
+    return tuple(state)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_secrets(db_state):
+    return crux.list() or []
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_secret_facets(db_state):
+    # Type and tag counts, shared by the dashboard metrics and the list filters
+    types = {}
+    tags = {}
+    for s in _cached_secrets(db_state):
+        t = s.get('type', 'secret')
+        types[t] = types.get(t, 0) + 1
+        for tag in s.get('tags', []):
+            tags[tag] = tags.get(tag, 0) + 1
+    return types, tags
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_audit_log(log_path, log_state):
+    # Last 100 entries, read backwards from the end of the file
+    return [json_loads(line) for line in read_last_lines(log_path, 100)]
+
+def _db_state():
+    db_path = ConfigManager().get_storage_path()
+    # In WAL mode writes land in store.db-wal before they reach store.db
+    return _file_state(db_path, db_path + "-wal")
+
 def load_secrets():
     try:
-        return crux.list() or []
+        return _cached_secrets(_db_state())
     except:
         return []
 
+def load_secret_facets():
+    try:
+        return _cached_secret_facets(_db_state())
+    except:
+        return {}, {}
+
 def load_audit_log():
     try:
         log_path = crux.get_audit_path()
         if log_path.exists():
-            logs = []
-            with open(log_path, 'r') as f:
-                for line in f:
-                    logs.append(json.loads(line))
-            return logs[-100:]  # Last 100 entries
+            return _cached_audit_log(str(log_path), _file_state(log_path))
         return []
     except:
         return []
 
 def get_metrics():
-    secrets = load_secrets()
+    # One read of the facets and the audit log covers the whole dashboard
     audit = load_audit_log()
-    
-    types = {}
-    tags = {}
-    for s in secrets:
-        t = s.get('type', 'secret')
-        types[t] = types.get(t, 0) + 1
-        for tag in s.get('tags', []):
-            tags[tag] = tags.get(tag, 0) + 1
+    types, tags = load_secret_facets()
+    # Entries are in write order and their ISO timestamps sort as strings, so the
+    # last 24h is everything after a bisect on the cutoff
+    cutoff = (datetime.utcnow() - timedelta(hours=24)).isoformat()
+    recent_ops = len(audit) - bisect.bisect_right([a['timestamp'] for a in audit], cutoff)
     
     return {
-        'total': len(secrets),
+        'total': sum(types.values()),
         'types': types,
         'tags': tags,
-        'recent_ops': len([a for a in audit if datetime.fromisoformat(a['timestamp']) > datetime.now() - timedelta(hours=24)])
+        'recent_ops': recent_ops,
+        'recent': audit[-5:][::-1],
     }
 
 if page == "📊 Dashboard":
@@ -129,10 +175,8 @@ if page == "📊 Dashboard":
             st.info("No tags yet")
     
     st.subheader("Recent Activity")
-    audit = load_audit_log()
-    if audit:
-        recent = audit[-5:][::-1]
-        for log in recent:
+    if metrics['recent']:
+        for log in metrics['recent']:
             status = "✅" if log['success'] else "❌"
             st.text(f"{status} {log['timestamp']} - {log['action'].upper()} {log['path']} by {log['user']}")
     else:
@@ -149,19 +193,19 @@ elif page == "🔑 Secrets":
             st.session_state.show_values = st.checkbox("Show Values", value=st.session_state.show_values)
         with col2:
             if st.button("🔄 Refresh", width='stretch'):
+                _cached_secrets.clear()
+                _cached_secret_facets.clear()
+                _cached_audit_log.clear()
                 st.rerun()
         
         secrets = load_secrets()
         
         if secrets:
+            all_types, all_tags = load_secret_facets()
             filter_col1, filter_col2 = st.columns(2)
             with filter_col1:
-                type_filter = st.multiselect("Filter by Type", 
-                    options=list(set([s.get('type', 'secret') for s in secrets])))
+                type_filter = st.multiselect("Filter by Type", options=list(all_types))
             with filter_col2:
-                all_tags = set()
-                for s in secrets:
-                    all_tags.update(s.get('tags', []))
                 tag_filter = st.multiselect("Filter by Tags", options=list(all_tags))
             
             filtered = secrets
@@ -171,6 +215,14 @@ elif page == "🔑 Secrets":
                 filtered = [s for s in filtered if any(t in s.get('tags', []) for t in tag_filter)]
             
             st.write(f"Showing {len(filtered)} of {len(secrets)} secrets")
+
+            # Fetch every shown value in one query instead of a get() per expander
+            values = {}
+            if st.session_state.show_values:
+                try:
+                    values = crux.mget([s['path'] for s in filtered])
+                except Exception as e:
+                    st.error(f"Error: {e}")
             
             for secret in filtered:
                 with st.expander(f"🔑 {secret['path']}"):
@@ -184,11 +236,8 @@ elif page == "🔑 Secrets":
                             st.text(f"Tags: {', '.join(secret['tags'])}")
                         
                         if st.session_state.show_values:
-                            try:
-                                value = crux.get(secret['path'])
-                                st.code(value, language=None)
-                            except Exception as e:
-                                st.error(f"Error: {e}")
+                            if secret['path'] in values:
+                                st.code(values[secret['path']], language=None)
                         else:
                             if st.button("👁️ Reveal", key=f"reveal_{secret['path']}"):
                                 try:
@@ -266,12 +315,14 @@ elif page == "🔑 Secrets":
         st.markdown("---")
         
         st.subheader("Export to .env")
-        st.download_button(
-            label="Download All Secrets(as txt)",
-            data=crux.export_env(),
-            file_name="secrets.env",
-            mime="text/plain"
-        )
+        # Only decrypt the whole vault once the export is asked for, not on every render
+        if st.button("Prepare .env export"):
+            st.download_button(
+                label="Download All Secrets(as txt)",
+                data=crux.export_env(),
+                file_name="secrets.env",
+                mime="text/plain"
+            )
             # st.info("Export feature requires CLI command: crux dev export")
 
     with tab4:
@@ -295,38 +346,36 @@ elif page == "📝 Audit Log":
     audit = load_audit_log()
     
     if audit:
+        # Parse timestamps once and filter with boolean masks instead of per-row Python
+        df = pd.DataFrame(audit)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format="ISO8601")
+
         col1, col2, col3 = st.columns(3)
         with col1:
             action_filter = st.multiselect("Filter by Action", 
-                options=list(set([a['action'] for a in audit])))
+                options=df['action'].unique().tolist())
         with col2:
             user_filter = st.multiselect("Filter by User",
-                options=list(set([a['user'] for a in audit])))
+                options=df['user'].unique().tolist())
         with col3:
             time_range = st.selectbox("Time Range", ["Last Hour", "Last 24 Hours", "Last Week", "All"])
         
-        filtered = audit
         if action_filter:
-            filtered = [a for a in filtered if a['action'] in action_filter]
+            df = df[df['action'].isin(action_filter)]
         if user_filter:
-            filtered = [a for a in filtered if a['user'] in user_filter]
+            df = df[df['user'].isin(user_filter)]
         
-        now = datetime.now()
-        if time_range == "Last Hour":
-            cutoff = now - timedelta(hours=1)
-            filtered = [a for a in filtered if datetime.fromisoformat(a['timestamp']) > cutoff]
-        elif time_range == "Last 24 Hours":
-            cutoff = now - timedelta(days=1)
-            filtered = [a for a in filtered if datetime.fromisoformat(a['timestamp']) > cutoff]
-        elif time_range == "Last Week":
-            cutoff = now - timedelta(weeks=1)
-            filtered = [a for a in filtered if datetime.fromisoformat(a['timestamp']) > cutoff]
+        windows = {
+            "Last Hour": timedelta(hours=1),
+            "Last 24 Hours": timedelta(days=1),
+            "Last Week": timedelta(weeks=1),
+        }
+        if time_range in windows:
+            df = df[df['timestamp'] > datetime.now() - windows[time_range]]
         
-        st.write(f"Showing {len(filtered)} of {len(audit)} events")
+        st.write(f"Showing {len(df)} of {len(audit)} events")
         
-        df = pd.DataFrame(filtered)
         if not df.empty:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
             df = df.sort_values('timestamp', ascending=False)
             st.dataframe(df, width='stretch', hide_index=True)
         else:
@@ -342,11 +391,10 @@ elif page == "📈 Analytics":
     
     if audit:
         df = pd.DataFrame(audit)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['date'] = df['timestamp'].dt.date
+        df = df.set_index(pd.to_datetime(df['timestamp'], format="ISO8601"))
         
         st.subheader("Activity Timeline")
-        daily_activity = df.groupby('date').size()
+        daily_activity = df.resample('D').size()
         st.line_chart(daily_activity)
         
         col1, col2 = st.columns(2)
@@ -364,7 +412,7 @@ elif page == "📈 Analytics":
         st.subheader("Most Accessed Secrets")
         get_operations = df[df['action'] == 'get']
         if not get_operations.empty:
-            top_secrets = get_operations['path'].value_counts().head(10)
+            top_secrets = get_operations['path'].value_counts(sort=False).nlargest(10)
             st.bar_chart(top_secrets)
         else:
             st.info("No get operations yet")
@@ -380,6 +428,11 @@ elif page == "⚙️ Settings":
         st.subheader("Security Information")
         
         st.info("🔐 Encryption: AES-256-GCM")
+        acceleration = aes_acceleration()
+        if acceleration["aes"] is False or acceleration["clmul"] is False:
+            st.warning(f"⚠️ No AES hardware acceleration detected ({acceleration['openssl_version']})")
+        else:
+            st.info(f"⚡ Crypto backend: {acceleration['openssl_version']}")
         st.info("🔑 Key Storage: System Keychain")
         
         st.subheader("Master Key")
@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from cruxvault.audit import logger as audit_logger
+from cruxvault.audit.logger import AuditLogger, _serialize, read_last_lines
+from cruxvault.models import AuditEntry
+
+
+@pytest.fixture
+def log_path() -> str:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "audit.log")
+
+
+class TestAuditLogger:
+    def test_get_recent_entries(self, log_path: str) -> None:
+        logger = AuditLogger(log_path)
+        for i in range(5):
+            logger.log("set", f"key{i}")
+
+        entries = logger.get_recent_entries(limit=3)
+
+        assert [e.path for e in entries] == ["key4", "key3", "key2"]
+
+    @pytest.mark.parametrize("chunk_size", [7, 64 * 1024])
+    def test_read_last_lines(
+        self, log_path: str, chunk_size: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(audit_logger, "_TAIL_CHUNK_SIZE", chunk_size)
+        with open(log_path, "wb") as f:
+            f.write(b"".join(f"line-{i}\n".encode() for i in range(50)))
+
+        assert read_last_lines(log_path, 3) == [b"line-47", b"line-48", b"line-49"]
+        assert len(read_last_lines(log_path, 500)) == 50
+        assert read_last_lines(log_path, 0) == []
+
+    def test_serialize_matches_with_and_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        entry = AuditEntry(user="u", action="set", path="api/key", metadata={"n": 1})
+
+        fast = json.loads(_serialize(entry))
+        monkeypatch.setattr(audit_logger, "orjson", None)
+        plain = json.loads(_serialize(entry))
+
+        assert fast == plain
+        assert set(plain) == set(AuditEntry.model_fields)
+
+    def test_get_recent_entries_missing_file(self, log_path: str) -> None:
+        logger = AuditLogger(log_path)
+
+        assert logger.get_recent_entries() == []
+
+    def test_get_entries_for_path(self, log_path: str) -> None:
+        logger = AuditLogger(log_path)
+        logger.log("set", "api/key")
+        logger.log("set", "api/key2")
+        logger.log("delete", "api/key")
+
+        entries = logger.get_entries_for_path("api/key")
+
+        assert [e.action for e in entries] == ["delete", "set"]
+        assert all(e.path == "api/key" for e in entries)
+
+    def test_buffered_logger_writes_on_flush(self, log_path: str) -> None:
+        logger = AuditLogger(log_path, buffered=True)
+        logger.log("set", "a")
+        logger.log("set", "b")
+
+        assert not os.path.exists(log_path)
+
+        logger.flush()
+
+        with open(log_path) as f:
+            assert len(f.readlines()) == 2
+
+    def test_log_file_is_owner_only(self, log_path: str) -> None:
+        logger = AuditLogger(log_path)
+        logger.log("set", "a")
+        logger.close()
+
+        assert os.stat(log_path).st_mode & 0o777 == 0o600
@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -7,6 +8,7 @@ import pytest
 from typer.testing import CliRunner
 
 from cruxvault.cli import app
+from cruxvault.utils.utils import reset_storage_cache
 
 runner = CliRunner()
 
@@ -18,6 +20,27 @@ def temp_dir():
         os.chdir(tmpdir)
         yield tmpdir
         os.chdir(original_dir)
+        reset_storage_cache()
+
+
+@pytest.fixture(scope="session")
+def seeded_vault(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Run `init` once per session; tests that need a project start from a copy of it
+    seed = tmp_path_factory.mktemp("seed")
+    original_dir = os.getcwd()
+    os.chdir(seed)
+    try:
+        assert runner.invoke(app, ["init"]).exit_code == 0
+    finally:
+        os.chdir(original_dir)
+        reset_storage_cache()
+    return seed / ".cruxvault"
+
+
+@pytest.fixture
+def vault_dir(temp_dir: str, seeded_vault: Path) -> str:
+    shutil.copytree(seeded_vault, os.path.join(temp_dir, ".cruxvault"))
+    return temp_dir
 
 
 class TestCLI:
@@ -29,6 +52,21 @@ class TestCLI:
         assert os.path.exists(".cruxvault/config.yaml")
         assert os.path.exists(".cruxvault/store.db")
 
+    def test_init_survives_failed_aes_probe(
+        self, temp_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from cruxvault.crypto import utils
+
+        def broken_probe() -> dict:
+            raise ImportError("no openssl backend")
+
+        monkeypatch.setattr(utils, "aes_acceleration", broken_probe)
+        result = runner.invoke(app, ["init"])
+
+        assert result.exit_code == 0
+        assert "Initialized cruxvault" in result.stdout
+        assert "Initialization failed" not in result.stdout
+
     def test_init_already_initialized(self, temp_dir: str) -> None:
         runner.invoke(app, ["init"])
         result = runner.invoke(app, ["init"])
@@ -36,9 +74,7 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Already initialized" in result.stdout
 
-    def test_set_and_get_secret(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_set_and_get_secret(self, vault_dir: str) -> None:
         result = runner.invoke(app, ["set", "test/key", "test-value"])
         assert result.exit_code == 0
         assert "Set test/key" in result.stdout
@@ -47,23 +83,30 @@ class TestCLI:
         assert result.exit_code == 0
         assert "test-value" in result.stdout
 
-    def test_get_nonexistent_secret(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_get_nonexistent_secret(self, vault_dir: str) -> None:
         result = runner.invoke(app, ["get", "nonexistent"])
         assert result.exit_code == 1
         assert "not found" in result.stdout
 
-    def test_set_with_tags(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_set_with_tags(self, vault_dir: str) -> None:
         result = runner.invoke(
             app, ["set", "api/key", "value", "--tag", "production", "--tag", "important"]
         )
         assert result.exit_code == 0
 
-    def test_get_with_json_output(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_get_quiet_fast_path(
+        self, vault_dir: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        from cruxvault.__main__ import main
+
+        runner.invoke(app, ["set", "test/key", "test-value"])
+
+        monkeypatch.setattr("sys.argv", ["crux", "get", "test/key", "-q"])
+        main()
+
+        assert capsys.readouterr().out == "test-value\n"
+
+    def test_get_with_json_output(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "test/key", "test-value"])
 
         result = runner.invoke(app, ["get", "test/key", "--json"])
@@ -73,16 +116,14 @@ class TestCLI:
         assert data["path"] == "test/key"
         assert data["value"] == "test-value"
 
-    def test_get_with_quiet_flag(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_get_with_quiet_flag(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "test/key", "test-value"])
 
         result = runner.invoke(app, ["get", "test/key", "--quiet"])
         assert result.exit_code == 0
         assert result.stdout.strip() == "test-value"
 
-    def test_list_secrets(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_list_secrets(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "api/key1", "value1"])
         runner.invoke(app, ["set", "api/key2", "value2"])
         runner.invoke(app, ["set", "db/password", "value3"])
@@ -94,8 +135,7 @@ class TestCLI:
         assert "db/password" in result.stdout
         assert "Total: 3" in result.stdout
 
-    def test_list_with_prefix(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_list_with_prefix(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "api/key1", "value1"])
         runner.invoke(app, ["set", "api/key2", "value2"])
         runner.invoke(app, ["set", "db/password", "value3"])
@@ -106,8 +146,7 @@ class TestCLI:
         assert "api/key2" in result.stdout
         assert "db/password" not in result.stdout
 
-    def test_list_with_json_output(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_list_with_json_output(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "test/key", "test-value"])
 
         result = runner.invoke(app, ["list", "--json"])
@@ -118,8 +157,7 @@ class TestCLI:
         assert len(data) == 1
         assert data[0]["path"] == "test/key"
 
-    def test_delete_secret(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_delete_secret(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "test/key", "value"])
 
         result = runner.invoke(app, ["delete", "test/key", "--force"])
@@ -129,15 +167,12 @@ class TestCLI:
         result = runner.invoke(app, ["get", "test/key"])
         assert result.exit_code == 1
 
-    def test_delete_nonexistent_secret(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_delete_nonexistent_secret(self, vault_dir: str) -> None:
         result = runner.invoke(app, ["delete", "nonexistent", "--force"])
         assert result.exit_code == 1
         assert "not found" in result.stdout
 
-    def test_history_command(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_history_command(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "api/key", "value1"])
         runner.invoke(app, ["set", "api/key", "value2"])
         runner.invoke(app, ["set", "api/key", "value3"])
@@ -149,8 +184,7 @@ class TestCLI:
         assert "value2" in result.stdout
         assert "value3" in result.stdout
 
-    def test_rollback_command(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_rollback_command(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "api/key", "value1"])
         runner.invoke(app, ["set", "api/key", "value2"])
 
@@ -161,9 +195,7 @@ class TestCLI:
         result = runner.invoke(app, ["get", "api/key"])
         assert "value1" in result.stdout
 
-    def test_dev_start_command(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_dev_start_command(self, vault_dir: str) -> None:
         result = runner.invoke(app, ["dev", "start"])
         assert result.exit_code == 0
         assert "Generated" in result.stdout
@@ -171,8 +203,7 @@ class TestCLI:
         result = runner.invoke(app, ["list"])
         assert "database/pa" in result.stdout
 
-    def test_dev_export_command(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_dev_export_command(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "database/password", "secret123"])
         runner.invoke(app, ["set", "api/key", "abc123"])
 
@@ -181,8 +212,7 @@ class TestCLI:
         assert "DATABASE_PASSWORD=" in result.stdout
         assert "API_KEY=" in result.stdout
 
-    def test_dev_export_to_file(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_dev_export_to_file(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "test/key", "value"])
 
         output_file = "test.env"
@@ -194,9 +224,7 @@ class TestCLI:
             content = f.read()
             assert "TEST_KEY=" in content
 
-    def test_import_env_command(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_import_env_command(self, vault_dir: str) -> None:
         env_content = """
 DATABASE_HOST=localhost
 DATABASE_PORT=5432
@@ -216,9 +244,7 @@ EMPTY_LINE_BELOW=
         result = runner.invoke(app, ["get", "database/host"])
         assert "localhost" in result.stdout
 
-    def test_import_env_with_prefix(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
-
+    def test_import_env_with_prefix(self, vault_dir: str) -> None:
         env_content = "KEY=value\n"
         env_file = "test.env"
         with open(env_file, "w") as f:
@@ -230,8 +256,7 @@ EMPTY_LINE_BELOW=
         result = runner.invoke(app, ["get", "prod/key"])
         assert "value" in result.stdout
 
-    def test_audit_log_created(self, temp_dir: str) -> None:
-        runner.invoke(app, ["init"])
+    def test_audit_log_created(self, vault_dir: str) -> None:
         runner.invoke(app, ["set", "test/key", "value"])
 
         assert os.path.exists(".cruxvault/audit.log")
@@ -246,3 +271,63 @@ EMPTY_LINE_BELOW=
                 assert "user" in data
                 assert "action" in data
 
+    def test_config_parse_shared_until_file_changes(self, vault_dir: str) -> None:
+        from cruxvault.config import ConfigManager
+
+        config = ConfigManager().load_config()
+        assert ConfigManager().load_config() is config
+
+        updated = config.model_copy(deep=True)
+        updated.audit.enabled = False
+        ConfigManager().save_config(updated)
+        assert ConfigManager().load_config().audit.enabled is False
+
+    def test_cached_storage_follows_config_edits(self, vault_dir: str) -> None:
+        from cruxvault.config import ConfigManager
+        from cruxvault.utils.utils import get_storage_and_audit
+
+        storage, audit_logger = get_storage_and_audit()
+        assert get_storage_and_audit() == (storage, audit_logger)
+        assert audit_logger.enabled is True
+
+        config = ConfigManager().load_config().model_copy(deep=True)
+        config.audit.enabled = False
+        ConfigManager().save_config(config)
+        os.utime(ConfigManager().config_path, ns=(0, 0))
+
+        _, audit_logger = get_storage_and_audit()
+        assert audit_logger.enabled is False
+
+    def test_api_get_skips_caching_a_read_raced_by_a_write(
+        self, vault_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from cruxvault import CruxVault
+
+        crux = CruxVault()
+        crux.set("race/key", "old")
+        read_secret = crux._storage.get_secret
+
+        def get_then_write(path: str):
+            # Another writer lands between the storage read and the cache fill
+            secret = read_secret(path)
+            monkeypatch.setattr(crux._storage, "get_secret", read_secret)
+            crux.set("race/key", "new")
+            return secret
+
+        monkeypatch.setattr(crux._storage, "get_secret", get_then_write)
+
+        assert crux.get("race/key") == "old"
+        assert crux.get("race/key") == "new"
+
+    def test_cached_audit_logger_follows_audit_reads_env(
+        self, vault_dir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from cruxvault.utils.utils import get_storage_and_audit
+
+        monkeypatch.setenv("CRUXVAULT_AUDIT_READS", "0")
+        _, audit_logger = get_storage_and_audit()
+        assert audit_logger.log_reads is False
+
+        monkeypatch.setenv("CRUXVAULT_AUDIT_READS", "1")
+        _, audit_logger = get_storage_and_audit()
+        assert audit_logger.log_reads is True
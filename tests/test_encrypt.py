@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from cruxvault.crypto.encryption import AESGCM, Encryptor, EncryptionError
@@ -62,6 +64,17 @@ class TestEncryptor:
 
         assert decrypted == plaintext
 
+    def test_encrypt_bytes_round_trip(self) -> None:
+        encryptor = Encryptor()
+        data = bytes(range(256))
+
+        combined = encryptor.encrypt_bytes(data)
+
+        assert encryptor.decrypt_bytes(combined) == data
+        assert len(combined) == 12 + len(data) + 16
+        with pytest.raises(EncryptionError):
+            encryptor.decrypt_bytes(combined[:-1])
+
     def test_invalid_master_key_length(self) -> None:
         with pytest.raises(EncryptionError):
             Encryptor(b"too-short")
@@ -72,6 +85,26 @@ class TestEncryptor:
         with pytest.raises(EncryptionError):
             encryptor.decrypt("invalid-base64-data")
 
+    def test_decrypt_many(self) -> None:
+        encryptor = Encryptor()
+        plaintexts = ["one", "", "héllo 🔑"]
+
+        encrypted = [encryptor.encrypt(p) for p in plaintexts]
+
+        assert encryptor.decrypt_many(encrypted) == plaintexts
+        with pytest.raises(EncryptionError):
+            encryptor.decrypt_many(encrypted + ["invalid-base64-data"])
+
+    def test_encrypt_many(self) -> None:
+        encryptor = Encryptor()
+        plaintexts = ["one", "", "héllo 🔑", "one"]
+
+        encrypted = encryptor.encrypt_many(plaintexts)
+
+        assert len(set(encrypted)) == len(plaintexts)
+        assert [encryptor.decrypt(e) for e in encrypted] == plaintexts
+        assert encryptor.encrypt_many([]) == []
+
     def test_key_generation(self) -> None:
         key1 = Encryptor.generate_key()
         key2 = Encryptor.generate_key()
@@ -99,3 +132,29 @@ class TestEncryptor:
         assert encryptor.decrypt(encrypted1) == plaintext
         assert encryptor.decrypt(encrypted2) == plaintext
 
+    def test_master_key_from_env_skips_keyring(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from cruxvault.crypto import utils
+
+        key = Encryptor.generate_key()
+        monkeypatch.setenv("UNIFIED_MASTER_KEY", Encryptor.key_to_string(key))
+        monkeypatch.setattr(utils, "_keyring_master_key", lambda: pytest.fail("keyring used"))
+
+        assert utils.get_or_create_master_key() == key
+
+    def test_aes_acceleration_reads_cpu_flags(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from cruxvault.crypto import utils
+
+        cpuinfo = tmp_path / "cpuinfo"
+        cpuinfo.write_text("processor\t: 0\nflags\t\t: fpu sse2 aes avx\n")
+        monkeypatch.setattr(utils, "_CPUINFO_PATH", str(cpuinfo))
+
+        info = utils.aes_acceleration()
+
+        assert info["aes"] is True
+        assert info["clmul"] is False
+        assert info["openssl_version"]
+
+        monkeypatch.setattr(utils, "_CPUINFO_PATH", str(tmp_path / "missing"))
+        assert utils.aes_acceleration()["aes"] is None
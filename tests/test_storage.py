@@ -35,6 +35,38 @@ class TestSQLiteStorage:
 
         assert os.path.exists(temp_db)
 
+    def test_open_backfills_indexes_on_existing_vault(self, temp_db: str) -> None:
+        import sqlite3
+
+        # A vault created before the composite history and snapshot indexes existed
+        conn = sqlite3.connect(temp_db)
+        conn.executescript(
+            """
+            CREATE TABLE secret_versions (
+                id INTEGER PRIMARY KEY, path VARCHAR(500) NOT NULL,
+                encrypted_value TEXT NOT NULL, version INTEGER NOT NULL,
+                created_at DATETIME NOT NULL, created_by VARCHAR(200)
+            );
+            CREATE INDEX ix_secret_versions_path ON secret_versions (path);
+            CREATE TABLE commit_secrets (
+                id INTEGER PRIMARY KEY, commit_id INTEGER NOT NULL,
+                path VARCHAR(500) NOT NULL, encrypted_value TEXT NOT NULL,
+                type VARCHAR(50) NOT NULL, tags TEXT NOT NULL
+            );
+            CREATE INDEX ix_commit_secrets_commit_id ON commit_secrets (commit_id);
+            """
+        )
+        conn.close()
+
+        SQLiteStorage(temp_db, Encryptor()).close()
+
+        conn = sqlite3.connect(temp_db)
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        conn.close()
+        indexes = {name for (name,) in rows}
+        assert "ix_secret_versions_path_version" in indexes
+        assert "ix_commit_secrets_commit_id_path" in indexes
+
     def test_set_and_get_secret(self, storage: SQLiteStorage) -> None:
         path = "database/password"
         value = "super-secret-123"
@@ -57,6 +89,18 @@ class TestSQLiteStorage:
         result = storage.get_secret("nonexistent/path")
         assert result is None
 
+    def test_get_secrets(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("db/host", "localhost")
+        storage.set_secret("db/url", "postgres://${db/host}")
+        storage.set_secret("api/key", "abc")
+
+        secrets = storage.get_secrets(["db/url", "missing", "api/key", "db/url"])
+
+        assert list(secrets) == ["db/url", "api/key"]
+        assert secrets["db/url"].value == "postgres://localhost"
+        assert secrets["api/key"].value == "abc"
+        assert storage.get_secrets([]) == {}
+
     def test_update_secret_increments_version(self, storage: SQLiteStorage) -> None:
         path = "api/key"
 
@@ -71,6 +115,43 @@ class TestSQLiteStorage:
         assert retrieved.value == "value2"
         assert retrieved.version == 2
 
+    def test_update_secret_keeps_created_at_and_type(self, storage: SQLiteStorage) -> None:
+        first = storage.set_secret("api/key", "value1", secret_type="config", tags=["a"])
+        second = storage.set_secret("api/key", "value2", secret_type="flag")
+
+        assert second.created_at == first.created_at
+        assert second.updated_at >= first.updated_at
+        assert second.type == SecretType.CONFIG
+        assert storage.get_secret("api/key").tags == []
+
+        history = storage.get_history("api/key")
+        assert [(v.version, v.value) for v in history] == [(2, "value2"), (1, "value1")]
+        assert history[1].created_at == first.updated_at
+
+    def test_get_secret_expands_references(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("db/host", "localhost")
+        storage.set_secret("db/user", "admin")
+        storage.set_secret("db/url", "postgres://${db/user}@${db/host}/${db/missing}")
+
+        secret = storage.get_secret("db/url")
+
+        assert secret.value == "postgres://admin@localhost/${db/missing}"
+
+    def test_get_secret_reference_cycle_and_reuse(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("a", "A[${b}]")
+        storage.set_secret("b", "B[${a}]")
+        storage.set_secret("pair", "${leaf}-${leaf}")
+        storage.set_secret("leaf", "x")
+
+        assert storage.get_secret("a").value == "A[B[${a}]]"
+
+        decrypt = storage.encryptor.decrypt
+        calls = []
+        storage.encryptor.decrypt = lambda v: calls.append(v) or decrypt(v)
+
+        assert storage.get_secret("pair").value == "x-x"
+        assert len(calls) == 2
+
     def test_set_secret_with_tags(self, storage: SQLiteStorage) -> None:
         path = "stripe/key"
         tags = ["production", "payment"]
@@ -121,6 +202,42 @@ class TestSQLiteStorage:
         assert "api/key2" in paths
         assert "database/password" not in paths
 
+    def test_list_secrets_without_decrypting(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("api/key", "value1")
+
+        secrets = storage.list_secrets(decrypt_values=False)
+
+        assert [s.path for s in secrets] == ["api/key"]
+        assert secrets[0].value == "•" * 8
+
+    def test_list_secrets_with_tag(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("api/key", "value1", tags=["prod", "api"])
+        storage.set_secret("api/dev_key", "value2", tags=["dev"])
+        storage.set_secret("db/password", "value3", tags=["prod"])
+
+        secrets = storage.list_secrets(tag="prod")
+        assert [s.path for s in secrets] == ["api/key", "db/password"]
+
+        secrets = storage.list_secrets(prefix="api/", tag="prod")
+        assert [s.path for s in secrets] == ["api/key"]
+
+    def test_iter_secrets_streams_in_batches(self, storage: SQLiteStorage) -> None:
+        storage.set_secrets_bulk([(f"k{i:04d}", f"v{i}") for i in range(600)])
+
+        secrets = storage.iter_secrets()
+
+        assert next(secrets).path == "k0000"
+        assert [s.value for s in secrets] == [f"v{i}" for i in range(1, 600)]
+
+    def test_list_secrets_prefix_is_literal(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("api_key", "value1")
+        storage.set_secret("api_key/extra", "value2")
+        storage.set_secret("apiXkey", "value3")
+
+        secrets = storage.list_secrets(prefix="api_key")
+
+        assert [s.path for s in secrets] == ["api_key", "api_key/extra"]
+
     def test_delete_secret(self, storage: SQLiteStorage) -> None:
         path = "temp/secret"
         storage.set_secret(path, "value")
@@ -131,6 +248,27 @@ class TestSQLiteStorage:
         retrieved = storage.get_secret(path)
         assert retrieved is None
 
+    def test_delete_secret_drops_history(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("temp/secret", "value1")
+        storage.set_secret("temp/secret", "value2")
+
+        assert storage.delete_secret("temp/secret") is True
+        assert storage.get_history("temp/secret") == []
+
+        storage.set_secret("temp/secret", "value3")
+        assert [v.version for v in storage.get_history("temp/secret")] == [1]
+
+    def test_delete_secrets(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("a", "1")
+        storage.set_secret("a", "2")
+        storage.set_secret("b", "1")
+        storage.set_secret("keep", "1")
+
+        assert storage.delete_secrets(["a", "b", "missing", "a"]) == 2
+        assert [s.path for s in storage.list_secrets()] == ["keep"]
+        assert storage.get_history("a") == []
+        assert storage.delete_secrets([]) == 0
+
     def test_delete_nonexistent_secret(self, storage: SQLiteStorage) -> None:
         result = storage.delete_secret("nonexistent")
         assert result is False
@@ -184,6 +322,31 @@ class TestSQLiteStorage:
         with pytest.raises(ValueError, match="not found"):
             storage.rollback("nonexistent", 1)
 
+    @pytest.mark.parametrize(
+        "query, index",
+        [
+            (
+                "SELECT * FROM secret_versions WHERE path = 'a' ORDER BY version DESC",
+                "ix_secret_versions_path_version",
+            ),
+            (
+                "SELECT * FROM commit_secrets WHERE commit_id = 1 ORDER BY path",
+                "ix_commit_secrets_commit_id_path",
+            ),
+        ],
+    )
+    def test_lookups_use_composite_index(
+        self, storage: SQLiteStorage, query: str, index: str
+    ) -> None:
+        from sqlalchemy import text
+
+        with storage.engine.connect() as conn:
+            plan = conn.execute(text(f"EXPLAIN QUERY PLAN {query}")).fetchall()
+
+        details = " ".join(row[-1] for row in plan)
+        assert index in details
+        assert "TEMP B-TREE" not in details
+
     def test_log_audit(self, storage: SQLiteStorage) -> None:
         entry = AuditEntry(
             user="testuser",
@@ -217,3 +380,145 @@ class TestSQLiteStorage:
     def test_close(self, storage: SQLiteStorage) -> None:
         storage.close()
 
+
+    def test_set_secrets_bulk(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("api/key", "old")
+
+        secrets = storage.set_secrets_bulk(
+            [("api/key", "new"), ("db/host", "localhost")], secret_type="config", tags=["bulk"]
+        )
+
+        assert [s.path for s in secrets] == ["api/key", "db/host"]
+        assert secrets[0].version == 2
+        assert secrets[1].version == 1
+
+        retrieved = storage.get_secret("db/host")
+        assert retrieved is not None
+        assert retrieved.value == "localhost"
+        assert retrieved.type == SecretType.CONFIG
+        assert retrieved.tags == ["bulk"]
+
+        history = storage.get_history("api/key")
+        assert [v.value for v in history] == ["new", "old"]
+
+    def test_set_secrets_bulk_repeated_path(self, storage: SQLiteStorage) -> None:
+        secrets = storage.set_secrets_bulk([("api/key", "first"), ("api/key", "second")])
+
+        assert [s.version for s in secrets] == [1, 2]
+        assert storage.get_secret("api/key").value == "second"
+        assert [v.value for v in storage.get_history("api/key")] == ["second", "first"]
+
+    def test_list_secrets_as_dicts(self, storage: SQLiteStorage) -> None:
+        storage.set_secret("api/key", "value1", tags=["prod"])
+        storage.set_secret("db/password", "value2")
+
+        rows = storage.list_secrets_as_dicts("api/")
+        assert rows == [s.model_dump(mode="json") for s in storage.list_secrets("api/")]
+
+        hidden = storage.list_secrets_as_dicts(decrypt_values=False)
+        assert [r["value"] for r in hidden] == ["•" * 8, "•" * 8]
+
+    def test_tuned_pragmas(self, temp_db: str) -> None:
+        storage = SQLiteStorage(temp_db, Encryptor())
+        storage.initialize()
+
+        from sqlalchemy import text
+
+        with storage.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA page_size")).scalar() == 8192
+            assert conn.execute(text("PRAGMA auto_vacuum")).scalar() == 2
+
+        storage.close()
+
+    def test_branch_commit_counts(self, storage: SQLiteStorage) -> None:
+        storage.create_branch("main")
+        storage.commit("main", "first")
+        storage.commit("main", "second")
+        storage.create_branch("feature", from_branch="main")
+        storage.commit("feature", "third")
+        storage.create_branch("empty")
+
+        counts = storage.get_branch_commit_counts()
+
+        assert counts == {"main": 2, "feature": 3, "empty": 0}
+        for name, count in counts.items():
+            assert len(storage.get_commit_history(name, limit=1000)) == count
+
+    def test_commit_history_newest_first_with_limit(self, storage: SQLiteStorage) -> None:
+        storage.create_branch("main")
+        for message in ("one", "two", "three"):
+            storage.commit("main", message)
+
+        history = storage.get_commit_history("main", limit=2)
+
+        assert [c.message for c in history] == ["three", "two"]
+        assert history[0].parent_id == history[1].id
+        assert storage.get_commit_history("main", limit=0) == []
+
+    def test_diff_commits(self, storage: SQLiteStorage) -> None:
+        storage.create_branch("main")
+        storage.set_secret("kept", "same")
+        storage.set_secret("changed", "old")
+        storage.set_secret("removed", "gone")
+        first = storage.commit("main", "first")
+        storage.set_secret("changed", "new")
+        storage.set_secret("added", "fresh")
+        storage.delete_secret("removed")
+        second = storage.commit("main", "second")
+
+        diff = storage.diff_commits(first.id, second.id)
+
+        assert [(d.path, d.status, d.old_value, d.new_value) for d in diff] == [
+            ("added", "added", None, "fresh"),
+            ("changed", "modified", "old", "new"),
+            ("removed", "deleted", "gone", None),
+        ]
+
+    def test_merge_branch_reports_conflicts(self, storage: SQLiteStorage) -> None:
+        storage.create_branch("main")
+        storage.set_secret("shared", "base")
+        storage.set_secret("same", "x")
+        storage.commit("main", "base")
+        storage.create_branch("feature", from_branch="main")
+        storage.set_secret("shared", "changed")
+        storage.set_secret("new", "y")
+        storage.commit("feature", "change")
+
+        merged, conflicts = storage.merge_branch("main", "feature")
+
+        assert merged is False
+        assert [(c.path, c.current_value, c.incoming_value) for c in conflicts] == [
+            ("shared", "base", "changed")
+        ]
+
+    def test_get_status(self, storage: SQLiteStorage) -> None:
+        storage.create_branch("main")
+        storage.set_secret("b", "1")
+        assert storage.get_status("main") == {"added": ["b"], "modified": [], "deleted": []}
+
+        storage.set_secret("kept", "x")
+        storage.set_secret("gone", "x")
+        storage.commit("main", "first")
+        storage.set_secret("b", "2")
+        storage.set_secret("a", "new")
+        storage.delete_secret("gone")
+
+        assert storage.get_status("main") == {
+            "added": ["a"],
+            "modified": ["b"],
+            "deleted": ["gone"],
+        }
+
+    def test_get_and_list_branches(self, storage: SQLiteStorage) -> None:
+        storage.create_branch("main")
+        commit = storage.commit("main", "first")
+        storage.create_branch("feature", from_branch="main")
+
+        feature = storage.get_branch("feature")
+
+        assert feature.head_commit_id == commit.id
+        assert isinstance(feature.created_at, datetime)
+        assert storage.get_branch("missing") is None
+        assert sorted(b.name for b in storage.list_branches()) == ["feature", "main"]